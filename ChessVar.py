@@ -0,0 +1,1535 @@
+# Author: Brenna Wilson
+# GitHub username: brennaswilson
+# Date: 3/13/24
+# Description: chess game, follows basic rules, includes two extra "Fairy" pieces, does not include check or checkmate,
+# and there is no castling, en passant, or pawn promotion
+
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+
+class ChessVar:
+    """sets up rules and controls game"""
+
+    def __init__(self):
+        self._set_empty_position()
+
+        # pieces hold nothing but their type and color, so every square shares one instance of each (see get_piece)
+        back_row = ['Rook', 'Knight', 'Bishop', 'Queen', 'King', 'Bishop', 'Knight', 'Rook']
+        for col, piece_name in enumerate(back_row):
+            self._place_piece(0, col, _PIECES[(piece_name, 'w')])
+            self._place_piece(1, col, _PIECES[('Pawn', 'w')])
+            self._place_piece(6, col, _PIECES[('Pawn', 'b')])
+            self._place_piece(7, col, _PIECES[(piece_name, 'b')])
+        self._fairy_pieces_white = ['Falcon', 'Hunter']
+        self._fairy_pieces_black = ['Falcon', 'Hunter']
+        self._refresh_position()
+
+    def _set_empty_position(self):
+        """sets every attribute for an empty board, white to move, nothing lost and no fairy pieces in reserve, with
+        attack map, evaluation, move cache and profiler off. Used by __init__ and from_bytes"""
+        self._game_state = 'UNFINISHED'
+        self._turn = 'w'
+        self._clear_board()
+        self._white_player_lost_pieces = []
+        self._black_player_lost_pieces = []
+        self._fairy_pieces_white = []
+        self._fairy_pieces_black = []
+
+        # number of each piece type each player has lost, kept alongside the lost piece lists so game state and fairy
+        # piece checks do not scan them. A King count of 1 means that player's king was captured
+        self._lost_piece_counts = {
+            'w': dict.fromkeys(_PIECE_NAMES, 0),
+            'b': dict.fromkeys(_PIECE_NAMES, 0),
+        }
+
+        # one (move, captured piece, game state before move, fairy piece's reserve index, hash before move) per move,
+        # for pop_move
+        self._undo_stack = []
+
+        # attack map, off until enable_attack_map: attack counts per color and square, squares each occupied square's
+        # piece attacks as (color, squares), and squares whose pieces attack each square
+        self._attack_counts = None
+        self._attacks_from = None
+        self._attackers = None
+
+        # evaluation, off until enable_evaluation: score tables and running score for white
+        self._square_scores = None
+        self._reserve_scores = None
+        self._score = None
+
+        # MoveCache answering valid_move, off until set_move_cache
+        self._move_cache = None
+
+        # chess_profile.Profiler timing make_move and enter_fairy_piece stages, off until set_profiler
+        self._profiler = None
+
+        # Zobrist hash of position and set of squares holding each color's pieces, updated by every move
+        self._hash = 0
+        self._piece_squares = {'w': set(), 'b': set()}
+
+    def get_board(self):
+        """returns current state of chess board"""
+        return self._board
+
+    def get_game_state(self):
+        """returns 'UNFINISHED', 'WHITE_WON', or 'BLACK_WON' based on current state of game"""
+        return self._game_state
+
+    def get_turn(self):
+        """returns which player's turn it is (white or black, game always starts with white)"""
+        return self._turn
+
+    def get_piece_on(self, square):
+        """returns piece on square index (row * 8 + col), or None if square is empty"""
+        return self._piece_at(square >> 3, square & 7)
+
+    def get_piece_squares(self, color):
+        """returns sorted list of square indexes holding color's pieces"""
+        return sorted(self._piece_squares[color])
+
+    def get_king_square(self, color):
+        """returns square index of color's king, or None if it was captured"""
+        for square in self._piece_squares[color]:
+            if self._piece_at(square >> 3, square & 7).get_name() == 'King':
+                return square
+        return None
+
+    def get_fairy_reserve(self, color):
+        """returns list of fairy pieces color still holds in reserve"""
+        if color == 'w':
+            return list(self._fairy_pieces_white)
+        return list(self._fairy_pieces_black)
+
+    def get_lost_piece_count(self, color, piece_name):
+        """returns how many of given piece type color ('w' or 'b') has lost to captures"""
+        return self._lost_piece_counts[color][piece_name]
+
+    def get_book_moves(self, book):
+        """returns list of (move, weight) the opening book (chess_book.OpeningBook) has for current position"""
+        return book.lookup(self._hash)
+
+    def get_moves_played(self):
+        """returns array of packed moves made so far, playing them on a new game gives the same position"""
+        return array('H', [undo[0] for undo in self._undo_stack])
+
+    def get_hash(self):
+        """returns 64-bit Zobrist hash of position: pieces on board, player to move, and fairy pieces in reserve"""
+        return self._hash
+
+    def to_bytes(self):
+        """returns position packed into POSITION_SIZE bytes, see pack_into for the layout"""
+        buffer = bytearray(POSITION_SIZE)
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def pack_into(self, buffer, offset=0):
+        """writes position into writable buffer (bytearray, mmap, memoryview) at offset, POSITION_SIZE bytes:
+        format version, 64 squares (0 empty, else piece code), turn, game state, lost piece counts for the original
+        piece types (white then black), a reserve byte with a bit for each fairy piece not yet entered, then white and
+        black lost counts of each piece type added later. The POSITION_*_OFFSET constants give where each part
+        starts"""
+        view = memoryview(buffer)
+        view[offset] = POSITION_FORMAT_VERSION
+        squares = offset + POSITION_SQUARES_OFFSET
+        for square in range(64):
+            chess_piece = self._piece_at(square >> 3, square & 7)
+            if chess_piece is None:
+                view[squares + square] = 0
+            else:
+                view[squares + square] = _PIECE_CODES[(chess_piece.get_name(), chess_piece.get_color())]
+        view[offset + POSITION_TURN_OFFSET] = _TURN_CODES[self._turn]
+        view[offset + POSITION_GAME_STATE_OFFSET] = _GAME_STATE_CODES[self._game_state]
+        for piece_name, lost_white, lost_black, _ in _LOST_PIECE_OFFSETS:
+            view[offset + lost_white] = self._lost_piece_counts['w'][piece_name]
+            view[offset + lost_black] = self._lost_piece_counts['b'][piece_name]
+        reserve = 0
+        for piece in self._fairy_pieces_white:
+            reserve |= _RESERVE_BITS[('w', piece)]
+        for piece in self._fairy_pieces_black:
+            reserve |= _RESERVE_BITS[('b', piece)]
+        view[offset + POSITION_RESERVE_OFFSET] = reserve
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """returns new game with position read from data (bytes, memoryview, mmap) at offset, as written by
+        pack_into, by this version of the format or an earlier one. Reads straight from the buffer without copying
+        it. The game has no moves to pop_move. Raises ValueError if data is too short or does not hold a valid
+        position"""
+        view = memoryview(data)
+        if offset < 0 or offset >= len(view):
+            raise ValueError('no position at offset %d' % offset)
+        version = view[offset]
+        if not 1 <= version <= POSITION_FORMAT_VERSION:
+            raise ValueError('unknown position format ' + str(version))
+        size = POSITION_RESERVE_OFFSET + 1 + 2 * (version - 1)
+        if len(view) - offset < size:
+            raise ValueError('position needs %d bytes at offset %d' % (size, offset))
+        turn_code = view[offset + POSITION_TURN_OFFSET]
+        game_state_code = view[offset + POSITION_GAME_STATE_OFFSET]
+        if turn_code >= len(_TURN_NAMES) or game_state_code >= len(_GAME_STATE_NAMES):
+            raise ValueError('bad turn or game state code')
+
+        # start from an empty board instead of setting up and clearing the starting position
+        game = cls.__new__(cls)
+        game._set_empty_position()
+        squares = offset + POSITION_SQUARES_OFFSET
+        # codes of the piece types the record's version has
+        code_limit = 2 * (_ORIGINAL_PIECE_COUNT + version - 1)
+        for square, code in enumerate(view[squares:squares + 64]):
+            if code:
+                if code > code_limit:
+                    raise ValueError('bad piece code %d on square %d' % (code, square))
+                game._place_piece(square >> 3, square & 7, _CODE_PIECES[code])
+        game._turn = _TURN_NAMES[turn_code]
+        game._game_state = _GAME_STATE_NAMES[game_state_code]
+
+        for piece_name, lost_white, lost_black, first_version in _LOST_PIECE_OFFSETS:
+            if first_version > version:
+                continue
+            game._lost_piece_counts['w'][piece_name] = view[offset + lost_white]
+            game._lost_piece_counts['b'][piece_name] = view[offset + lost_black]
+            game._white_player_lost_pieces.extend([_PIECES[(piece_name, 'w')]] * view[offset + lost_white])
+            game._black_player_lost_pieces.extend([_PIECES[(piece_name, 'b')]] * view[offset + lost_black])
+
+        reserve = view[offset + POSITION_RESERVE_OFFSET]
+        game._fairy_pieces_white = [piece for piece in ('Falcon', 'Hunter') if reserve & _RESERVE_BITS[('w', piece)]]
+        game._fairy_pieces_black = [piece for piece in ('Falcon', 'Hunter') if reserve & _RESERVE_BITS[('b', piece)]]
+        game._refresh_position()
+        return game
+
+    def _refresh_position(self):
+        """rebuilds piece squares, hash and attack map (if on) from the board, for boards set up without moves"""
+        self._piece_squares = {'w': set(), 'b': set()}
+        for square in range(64):
+            chess_piece = self._piece_at(square >> 3, square & 7)
+            if chess_piece is not None:
+                self._piece_squares[chess_piece.get_color()].add(square)
+        self._hash = self._compute_hash()
+        if self._attacks_from is not None:
+            self.enable_attack_map()
+        if self._square_scores is not None:
+            self._score = self._compute_score()
+
+    def _compute_hash(self):
+        """returns Zobrist hash of position built from scratch from the piece squares, moves update self._hash
+        instead"""
+        position_hash = 0
+        for color in ('w', 'b'):
+            for square in self._piece_squares[color]:
+                position_hash ^= _ZOBRIST_PIECES[(color, self._piece_at(square >> 3, square & 7).get_name())][square]
+        if self._turn == 'b':
+            position_hash ^= _ZOBRIST_BLACK_TO_MOVE
+        for piece in self._fairy_pieces_white:
+            position_hash ^= _ZOBRIST_RESERVE[('w', piece)]
+        for piece in self._fairy_pieces_black:
+            position_hash ^= _ZOBRIST_RESERVE[('b', piece)]
+        return position_hash
+
+    def make_move(self, square_from, square_to):
+        """takes in square moved from and to, returns False if: contains piece that is not players, move is not legal
+        game was already won
+        Else: indicate move, remove any captured piece, update game state as necessary, update turn, and return True
+        Needs each Chess Piece subclass, valid_move function to execute as intended"""
+
+        if self._profiler is not None:
+            return self._profiled_make_move(square_from, square_to)
+
+        # convert squares from string to indices
+        from_col, from_row = _parse_square(square_from)
+        to_col, to_row = _parse_square(square_to)
+
+        return self._make_move(from_col, from_row, to_col, to_row)
+
+    def _profiled_make_move(self, square_from, square_to):
+        """make_move recording time spent parsing, in valid_move and in _apply_move with the profiler"""
+        profiler = self._profiler
+        start = time.perf_counter()
+        from_col, from_row = _parse_square(square_from)
+        to_col, to_row = _parse_square(square_to)
+        parsed = time.perf_counter()
+        profiler.record('parse', parsed - start)
+
+        valid = self.valid_move(from_col, from_row, to_col, to_row)
+        checked = time.perf_counter()
+        profiler.record('valid_move', checked - parsed)
+        if not valid:
+            profiler.count('rejected_moves')
+            return False
+
+        self._apply_move(from_col, from_row, to_col, to_row)
+        profiler.record('apply_move', time.perf_counter() - checked)
+        if self._undo_stack[-1][1] is not None:
+            profiler.count('captures')
+        if self._game_state != 'UNFINISHED':
+            profiler.count('games_won')
+        return True
+
+    def _make_move(self, from_col, from_row, to_col, to_row):
+        """make_move once squares are converted to indices, shared by make_move, push_move and replay"""
+
+        # return False if valid_move returns False, else, move piece and capture piece as necessary
+        if not self.valid_move(from_col, from_row, to_col, to_row):
+            return False
+        return self._apply_move(from_col, from_row, to_col, to_row)
+
+    def _apply_move(self, from_col, from_row, to_col, to_row):
+        """makes a move already known to be legal: moves piece, records any capture, updates game state and turn"""
+
+        previous_game_state = self._game_state
+        previous_hash = self._hash
+
+        from_square = from_row * 8 + from_col
+        to_square = to_row * 8 + to_col
+        chess_piece = self._piece_at(from_row, from_col)
+        captured_piece = self._move_piece(from_row, from_col, to_row, to_col)
+
+        piece_keys = _ZOBRIST_PIECES[(chess_piece.get_color(), chess_piece.get_name())]
+        self._hash ^= piece_keys[from_square] ^ piece_keys[to_square] ^ _ZOBRIST_BLACK_TO_MOVE
+        self._piece_squares[chess_piece.get_color()].discard(from_square)
+        self._piece_squares[chess_piece.get_color()].add(to_square)
+        if self._square_scores is not None:
+            piece_scores = self._square_scores[(chess_piece.get_color(), chess_piece.get_name())]
+            self._score += piece_scores[to_square] - piece_scores[from_square]
+
+        if captured_piece is not None:
+            if self._profiler is None:
+                self._record_capture(captured_piece, to_square)
+                self._update_game_state(captured_piece)
+            else:
+                start = time.perf_counter()
+                self._record_capture(captured_piece, to_square)
+                recorded = time.perf_counter()
+                self._update_game_state(captured_piece)
+                self._profiler.record('capture', recorded - start)
+                self._profiler.record('game_state', time.perf_counter() - recorded)
+
+        self._undo_stack.append(
+            (from_square | to_square << 6, captured_piece, previous_game_state, None, previous_hash))
+
+        if self._attacks_from is not None:
+            self._update_attacks((from_square, to_square))
+
+        # update player turn
+        if self._turn == 'w':
+            self._turn = 'b'
+            return True
+        else:
+            self._turn = 'w'
+            return True
+
+    def _record_capture(self, captured_piece, to_square):
+        """takes piece captured on to_square out of hash, piece squares and score, and adds it to its player's lost
+        pieces"""
+        self._hash ^= _ZOBRIST_PIECES[(captured_piece.get_color(), captured_piece.get_name())][to_square]
+        self._piece_squares[captured_piece.get_color()].discard(to_square)
+        if self._square_scores is not None:
+            self._score -= self._square_scores[(captured_piece.get_color(), captured_piece.get_name())][to_square]
+        self._lost_piece_counts[captured_piece.get_color()][captured_piece.get_name()] += 1
+        if captured_piece.get_color() == 'w':
+            self._white_player_lost_pieces.append(captured_piece)
+        else:
+            self._black_player_lost_pieces.append(captured_piece)
+
+    def _update_game_state(self, captured_piece):
+        """check if king was captured, if so, change game state to reflect who won"""
+        if captured_piece.get_name() == 'King':
+            if captured_piece.get_color() == 'w':
+                self._game_state = "BLACK_WON"
+            else:
+                self._game_state = "WHITE_WON"
+
+    def enter_fairy_piece(self, piece, square_to):
+        """takes in fairy piece to be entered and at which square. If position is not possible,
+        or fairy piece is not playable, returns False
+        Else: update board, update turn, and return True"""
+
+        if self._profiler is not None:
+            return self._profiled_enter_fairy_piece(piece, square_to)
+
+        # convert square from string to indices
+        to_col, to_row = _parse_square(square_to)
+
+        return self._enter_fairy_piece(piece, to_row, to_col)
+
+    def _profiled_enter_fairy_piece(self, piece, square_to):
+        """enter_fairy_piece recording time spent parsing and entering the piece with the profiler"""
+        profiler = self._profiler
+        start = time.perf_counter()
+        to_col, to_row = _parse_square(square_to)
+        parsed = time.perf_counter()
+        profiler.record('parse', parsed - start)
+
+        entered = self._enter_fairy_piece(piece, to_row, to_col)
+        profiler.record('enter_fairy_piece', time.perf_counter() - parsed)
+        if not entered:
+            profiler.count('rejected_moves')
+        return entered
+
+    def _enter_fairy_piece(self, piece, to_row, to_col):
+        """enter_fairy_piece once square is converted to indices, shared by enter_fairy_piece and push_move"""
+
+        # return False if game is won
+        if self._game_state != 'UNFINISHED':
+            return False
+
+        # return False if square is off the board
+        if not 0 <= to_col <= 7 or not 0 <= to_row <= 7:
+            return False
+
+        if self._piece_at(to_row, to_col) is not None:
+            return False
+
+        # return False if fairy piece is not playable yet
+        if not self._fairy_piece_playable(piece):
+            return False
+
+        # remember where piece was in reserve so pop_move can put it back
+        if self._turn == 'w':
+            reserve_index = self._fairy_pieces_white.index(piece)
+        else:
+            reserve_index = self._fairy_pieces_black.index(piece)
+        self._undo_stack.append(
+            (_FAIRY_CODES[piece] << 12 | (to_row * 8 + to_col) << 6, None, self._game_state, reserve_index, self._hash))
+
+        # piece leaves reserve and lands on square, then other player's turn
+        self._hash ^= (_ZOBRIST_RESERVE[(self._turn, piece)] ^ _ZOBRIST_PIECES[(self._turn, piece)][to_row * 8 + to_col]
+                       ^ _ZOBRIST_BLACK_TO_MOVE)
+
+        # call make_move if everything else has not returned False
+        if self._turn == 'w':
+            if piece == 'Falcon':
+                self._place_piece(to_row, to_col, _PIECES[('Falcon', 'w')])
+                self._fairy_pieces_white.remove('Falcon')
+
+            if piece == 'Hunter':
+                self._fairy_pieces_white.remove('Hunter')
+                self._place_piece(to_row, to_col, _PIECES[('Hunter', 'w')])
+
+        if self._turn == 'b':
+            if piece == 'Falcon':
+                self._fairy_pieces_black.remove('Falcon')
+                self._place_piece(to_row, to_col, _PIECES[('Falcon', 'b')])
+            if piece == 'Hunter':
+                self._fairy_pieces_black.remove('Hunter')
+                self._place_piece(to_row, to_col, _PIECES[('Hunter', 'b')])
+
+        self._piece_squares[self._turn].add(to_row * 8 + to_col)
+        if self._square_scores is not None:
+            self._score += (self._square_scores[(self._turn, piece)][to_row * 8 + to_col]
+                            - self._reserve_scores[(self._turn, piece)])
+        if self._attacks_from is not None:
+            self._update_attacks((to_row * 8 + to_col,))
+
+        if self._turn == 'w':
+            self._turn = 'b'
+            return True
+        else:
+            self._turn = 'w'
+            return True
+
+    def push_move(self, move):
+        """makes packed move (from generate_moves or encode_move), returns False if move is not legal or not a packed
+        move, else returns True. Move can be taken back with pop_move"""
+        if not 0 <= move < _MOVE_LIMIT:
+            return False
+        from_square, to_square, fairy_piece = decode_move(move)
+        if fairy_piece is not None:
+            return self._enter_fairy_piece(fairy_piece, to_square >> 3, to_square & 7)
+        return self._make_move(from_square & 7, from_square >> 3, to_square & 7, to_square >> 3)
+
+    def replay(self, moves, trusted=False):
+        """plays packed moves (from encode_game, generate_moves or get_moves_played) in order, yields True or False
+        for each one like make_move and enter_fairy_piece would. With trusted=True moves are not checked by
+        valid_move, only use it for logs of games that were already validated. Values that are not packed moves
+        (a fairy code with no piece, more than 14 bits) yield False, trusted or not"""
+        for move in moves:
+            to_square = (move >> 6) & 63
+            if not 0 <= move < _MOVE_LIMIT:
+                yield False
+            elif move >> 12:
+                yield self._enter_fairy_piece(_FAIRY_NAMES[move >> 12], to_square >> 3, to_square & 7)
+            elif trusted:
+                yield self._apply_move(move & 7, (move >> 3) & 7, to_square & 7, to_square >> 3)
+            else:
+                yield self._make_move(move & 7, (move >> 3) & 7, to_square & 7, to_square >> 3)
+
+    def pop_move(self):
+        """takes back last move made (by make_move, enter_fairy_piece or push_move), restores board, turn, game state,
+        captured pieces and fairy pieces. Returns the packed move, or None if no moves have been made"""
+        if not self._undo_stack:
+            return None
+        move, captured_piece, game_state, reserve_index, position_hash = self._undo_stack.pop()
+        from_square, to_square, fairy_piece = decode_move(move)
+
+        # player who made the move
+        if self._turn == 'w':
+            self._turn = 'b'
+        else:
+            self._turn = 'w'
+
+        if move >> 12:
+            self._remove_piece(to_square >> 3, to_square & 7)
+            self._piece_squares[self._turn].discard(to_square)
+            if self._square_scores is not None:
+                self._score += (self._reserve_scores[(self._turn, fairy_piece)]
+                                - self._square_scores[(self._turn, fairy_piece)][to_square])
+            if self._turn == 'w':
+                self._fairy_pieces_white.insert(reserve_index, fairy_piece)
+            else:
+                self._fairy_pieces_black.insert(reserve_index, fairy_piece)
+        else:
+            self._move_piece(to_square >> 3, to_square & 7, from_square >> 3, from_square & 7)
+            self._piece_squares[self._turn].discard(to_square)
+            self._piece_squares[self._turn].add(from_square)
+            if self._square_scores is not None:
+                chess_piece = self._piece_at(from_square >> 3, from_square & 7)
+                piece_scores = self._square_scores[(chess_piece.get_color(), chess_piece.get_name())]
+                self._score += piece_scores[from_square] - piece_scores[to_square]
+            if captured_piece is not None:
+                self._place_piece(to_square >> 3, to_square & 7, captured_piece)
+                self._piece_squares[captured_piece.get_color()].add(to_square)
+                if self._square_scores is not None:
+                    captured_scores = self._square_scores[(captured_piece.get_color(), captured_piece.get_name())]
+                    self._score += captured_scores[to_square]
+                self._lost_piece_counts[captured_piece.get_color()][captured_piece.get_name()] -= 1
+                if captured_piece.get_color() == 'w':
+                    self._white_player_lost_pieces.pop()
+                else:
+                    self._black_player_lost_pieces.pop()
+
+        if self._attacks_from is not None:
+            if move >> 12:
+                self._update_attacks((to_square,))
+            else:
+                self._update_attacks((from_square, to_square))
+
+        self._game_state = game_state
+        self._hash = position_hash
+        return move
+
+    def enable_evaluation(self, square_scores, reserve_scores):
+        """starts keeping a running score for white: square_scores[(color, name)][square] for every piece on the board
+        plus reserve_scores[(color, name)] for every fairy piece still in reserve, black's entries negative. Kept up to
+        date by every move and pop_move from here on, chess_eval.Evaluator builds the tables"""
+        self._square_scores = square_scores
+        self._reserve_scores = reserve_scores
+        self._score = self._compute_score()
+
+    def disable_evaluation(self):
+        """stops keeping the running score started by enable_evaluation"""
+        self._square_scores = None
+        self._reserve_scores = None
+        self._score = None
+
+    def get_score(self):
+        """returns running score for white from enable_evaluation, or None if evaluation is off"""
+        return self._score
+
+    def get_evaluation_tables(self):
+        """returns (square_scores, reserve_scores) given to enable_evaluation, or None if evaluation is off"""
+        if self._square_scores is None:
+            return None
+        return self._square_scores, self._reserve_scores
+
+    def _compute_score(self):
+        """returns score for white built from scratch, moves update self._score instead"""
+        score = 0
+        for color in ('w', 'b'):
+            for square in self._piece_squares[color]:
+                chess_piece = self._piece_at(square >> 3, square & 7)
+                score += self._square_scores[(color, chess_piece.get_name())][square]
+        for piece in self._fairy_pieces_white:
+            score += self._reserve_scores[('w', piece)]
+        for piece in self._fairy_pieces_black:
+            score += self._reserve_scores[('b', piece)]
+        return score
+
+    def set_profiler(self, profiler):
+        """records make_move and enter_fairy_piece stages in profiler (a chess_profile.Profiler, can be shared by many
+        games) from here on, None turns profiling off"""
+        self._profiler = profiler
+
+    def get_profiler(self):
+        """returns profiler set with set_profiler, or None"""
+        return self._profiler
+
+    def set_move_cache(self, cache):
+        """answers valid_move from cache (a MoveCache, can be shared by many games) from here on, None turns it off"""
+        self._move_cache = cache
+
+    def get_move_cache(self):
+        """returns MoveCache used by valid_move, or None"""
+        return self._move_cache
+
+    def _cached_valid_move(self, from_col, from_row, to_col, to_row):
+        """valid_move answered from the position's set of legal moves in the move cache. Only normal moves are cached,
+        fairy piece entries also depend on lost pieces, which the hash does not cover"""
+        if self._game_state != 'UNFINISHED':
+            return False
+        if not 0 <= from_col <= 7 or not 0 <= from_row <= 7 or not 0 <= to_col <= 7 or not 0 <= to_row <= 7:
+            return False
+        legal_moves = self._move_cache.get(self._hash)
+        if legal_moves is None:
+            legal_moves = frozenset(move for move in self.generate_moves() if not move >> 12)
+            self._move_cache.put(self._hash, legal_moves)
+        return (from_row * 8 + from_col | (to_row * 8 + to_col) << 6) in legal_moves
+
+    def enable_attack_map(self):
+        """starts keeping count of how many of each color's pieces attack every square, kept up to date by every
+        move and pop_move from here on"""
+        self._attack_counts = {'w': [0] * 64, 'b': [0] * 64}
+        self._attacks_from = [None] * 64
+        self._attackers = [set() for _ in range(64)]
+        for square in range(64):
+            self._add_attacks(square)
+
+    def is_attacked(self, square, color):
+        """returns True if any of color's pieces attacks square ('e4' or square index), turns on the attack map the
+        first time it is called"""
+        return self.get_attack_count(square, color) > 0
+
+    def get_attack_count(self, square, color):
+        """returns number of color's pieces attacking square ('e4' or square index). A piece attacks the squares it
+        could capture on, squares held by its own side included"""
+        if self._attacks_from is None:
+            self.enable_attack_map()
+        if isinstance(square, str):
+            square = _SQUARE_INDEXES[square]
+        return self._attack_counts[color][square]
+
+    def _update_attacks(self, changed_squares):
+        """redoes attacks of pieces on changed squares and of pieces that attacked them, the only pieces whose
+        attacks a change to those squares can affect"""
+        sources = set(changed_squares)
+        for square in changed_squares:
+            sources |= self._attackers[square]
+        for square in sources:
+            self._remove_attacks(square)
+            self._add_attacks(square)
+
+    def _add_attacks(self, square):
+        """adds attacks of piece on square to attack map"""
+        chess_piece = self._piece_at(square >> 3, square & 7)
+        if chess_piece is None:
+            return
+        color = chess_piece.get_color()
+        attacked = self._attacked_squares(square, chess_piece)
+        counts = self._attack_counts[color]
+        for target in attacked:
+            counts[target] += 1
+            self._attackers[target].add(square)
+        self._attacks_from[square] = (color, attacked)
+
+    def _remove_attacks(self, square):
+        """takes attacks recorded for square out of attack map"""
+        if self._attacks_from[square] is None:
+            return
+        color, attacked = self._attacks_from[square]
+        counts = self._attack_counts[color]
+        for target in attacked:
+            counts[target] -= 1
+            self._attackers[target].discard(square)
+        self._attacks_from[square] = None
+
+    def _attacked_squares(self, square, chess_piece):
+        """returns list of square indexes piece on square attacks"""
+        key = (chess_piece.get_name(), chess_piece.get_color())
+        if key[0] == 'Pawn':
+            return [row * 8 + col for row, col in _PAWN_ATTACK_SQUARES[key[1]][square]]
+
+        attacked = [row * 8 + col for row, col in _JUMP_SQUARES[key][square]]
+        for ray in _SLIDE_RAYS[key][square]:
+            for row, col in ray:
+                attacked.append(row * 8 + col)
+                if self._piece_at(row, col) is not None:
+                    break
+        return attacked
+
+    def _fairy_piece_playable(self, piece):
+        """returns True if current player is allowed to enter given fairy piece, used by enter_fairy_piece and
+        generate_moves"""
+
+        # return False if piece is not a fairy piece
+        if piece not in _FAIRY_CODES:
+            return False
+
+        # calls get_playable from FairyPiece subclass to see if player can use fairy piece yet
+
+        lost_white = self._lost_piece_counts['w']
+        lost_black = self._lost_piece_counts['b']
+        needed_pieces_white = lost_white['Queen'] + lost_white['Knight'] + lost_white['Bishop']
+        needed_pieces_black = lost_black['Queen'] + lost_black['Knight'] + lost_black['Bishop']
+
+        # at least one fairy piece is available
+        if self._turn == 'w':
+            if needed_pieces_white == 0:
+                return False
+            else:
+                pass
+        else:
+            if needed_pieces_black == 0:
+                return False
+            else:
+                pass
+
+        # at least one fairy piece can be played at this point
+
+        # return False if fairy piece is already in play
+        if self._turn == 'w':
+            if piece == 'Falcon':
+                if "Falcon" in self._fairy_pieces_white:
+                    pass
+                else:
+                    return False
+        if self._turn == 'w':
+            if piece == 'Hunter':
+                if "Hunter" in self._fairy_pieces_white:
+                    pass
+                else:
+                    return False
+        if self._turn == 'b':
+            if piece == 'Falcon':
+                if "Falcon" in self._fairy_pieces_black:
+                    pass
+                else:
+                    return False
+
+        if self._turn == 'b':
+            if piece == 'Hunter':
+                if "Hunter" in self._fairy_pieces_black:
+                    pass
+                else:
+                    return False
+
+        # return False if one Fairy piece is in and not qualified to enter second fairy piece yet
+        # or no fairy pieces left, else continue on
+        fairy_pieces_remaining = 0
+
+        if self._turn == 'w':
+            for pieces in self._fairy_pieces_white:
+                fairy_pieces_remaining += 1
+            if fairy_pieces_remaining == 0:
+                return False  # no fairy pieces left to play
+            if fairy_pieces_remaining == 1 and needed_pieces_white > 1:
+                pass
+            if fairy_pieces_remaining == 2 and needed_pieces_white >= 1:
+                pass
+            else:
+                return False
+        if self._turn == 'b':
+            for pieces in self._fairy_pieces_black:
+                fairy_pieces_remaining += 1
+            if fairy_pieces_remaining == 0:
+                return False            # no fairy pieces left to play
+            if fairy_pieces_remaining == 1 and needed_pieces_black > 1:
+                pass
+            if fairy_pieces_remaining == 2 and needed_pieces_black >= 1:
+                pass
+            else:
+                return False
+
+        return True
+
+    def valid_move(self, from_col, from_row, to_col, to_row):
+        """takes in parameters from make_mov and returns True if move is valid, else returns False
+        will be fed parameters from make_move function"""
+
+        # answer from position's legal moves if a move cache is set
+        if self._move_cache is not None:
+            return self._cached_valid_move(from_col, from_row, to_col, to_row)
+
+        from_square = [from_row, from_col]
+        to_square = [to_row, to_col]
+
+        # return False if game is won
+        if self._game_state != 'UNFINISHED':
+            return False
+
+        # return False if either square is out of bounds
+        if from_col < 0 or from_col > 7:  # square_from col is out of bounds
+            return False
+        if from_row < 0 or from_row > 7:  # square_from row is out of bounds
+            return False
+        if to_col < 0 or to_col > 7:  # square_to col is out of bounds
+            return False
+        if to_row < 0 or to_row > 7:  # square_to row is out of bounds
+            return False
+
+        # chess_piece variable
+        chess_piece = self._board[from_row][from_col]
+
+        # return False if square_from is empty
+        if chess_piece is None:
+            return False
+
+        # return False if square_from does not have current player's piece
+        if chess_piece.get_color() != self._turn:
+            return False
+
+        # return False if square_to has current player's piece
+        to_chess_piece = self._board[to_row][to_col]
+        if to_chess_piece is not None:
+            if to_chess_piece.get_color() == self._turn:
+                return False
+
+        # get list of all possible moves (includes spaces off board and w/ pieces on it)
+        if self._profiler is None:
+            possible_squares = chess_piece.piece_move(from_col, from_row, self._board, self._turn)
+        else:
+            start = time.perf_counter()
+            possible_squares = chess_piece.piece_move(from_col, from_row, self._board, self._turn)
+            self._profiler.record('piece_move', time.perf_counter() - start)
+
+        # if to_square not in possible_squares, return False
+        if to_square not in possible_squares:
+            return False
+
+        # no False's, return to make_move
+        return True
+
+    def generate_moves(self):
+        """returns array of every legal move for current player, including fairy piece entries, each move packed
+        into one int (see encode_move). Array is empty if game is won"""
+        moves = array('H')
+        if self._game_state != 'UNFINISHED':
+            return moves
+
+        # only squares holding current player's pieces, in board order
+        for from_square in sorted(self._piece_squares[self._turn]):
+            row, col = from_square >> 3, from_square & 7
+            for to_row, to_col in self._board[row][col].piece_move(col, row, self._board, self._turn):
+                moves.append(from_square | (to_row * 8 + to_col) << 6)
+
+        self._add_fairy_moves(moves)
+        return moves
+
+    def _add_fairy_moves(self, moves):
+        """adds an entry to each empty square for every fairy piece current player can enter"""
+        empty_squares = None
+        for piece in ('Falcon', 'Hunter'):
+            if self._fairy_piece_playable(piece):
+                if empty_squares is None:
+                    occupied = self._piece_squares['w'] | self._piece_squares['b']
+                    empty_squares = [square for square in range(64) if square not in occupied]
+                fairy_code = _FAIRY_CODES[piece] << 12
+                for square in empty_squares:
+                    moves.append(fairy_code | square << 6)
+
+    def _clear_board(self):
+        """sets up an empty board"""
+        self._board = [[None] * 8 for _ in range(8)]
+
+    def _piece_at(self, row, col):
+        """returns piece on given square, or None if square is empty"""
+        return self._board[row][col]
+
+    def _move_piece(self, from_row, from_col, to_row, to_col):
+        """moves piece on from square to to square, returns piece that was captured (None if square was empty)"""
+        captured_piece = self._board[to_row][to_col]
+        self._board[to_row][to_col] = self._board[from_row][from_col]
+        self._board[from_row][from_col] = None
+        return captured_piece
+
+    def _place_piece(self, row, col, piece):
+        """puts piece on given (empty) square, used when entering fairy pieces"""
+        self._board[row][col] = piece
+
+    def _remove_piece(self, row, col):
+        """takes piece off given square, used when taking back a fairy piece entry"""
+        self._board[row][col] = None
+
+
+# precomputed move geometry, built once at import. Squares are indexed row * 8 + col and hold [row, col] lists
+# in the same order piece_move walks them. Entries are shared, do not change them.
+
+# how each piece moves, as (row, col) vectors for white. Slides repeat the vector until the first piece in the way
+# (included if it can be captured), jumps move by the vector once. Black uses white's vectors mirrored top to bottom
+# unless 'black_slides' or 'black_jumps' are given, so the Falcon and Hunter keep their forward and backward moves
+# for both colors. Moves are generated jumps first, then slides in the order listed. Pawn rules do not fit vectors
+# and stay in Pawn.piece_move.
+#
+# Entries also set the piece order (Pawn first, then this dict's order) behind the Zobrist keys, the position format
+# codes and its lost piece counts. To add a piece:
+#   - add an entry at the end of this dict. That is enough for move generation, the bitboard backend, the attack
+#     map, chess_batch and chess_tablebase's move tables. A ChessPiece subclass is only needed for rules vectors
+#     cannot express, like Pawn's. The piece gets position format codes, lost counts and Zobrist keys of its own and
+#     the format version goes up by itself, existing position records and opening books stay valid
+#   - give it a value in chess_eval.PIECE_VALUES (search and move ordering look it up), and a letter in
+#     chess_tablebase.PIECE_LETTERS if tablebases should cover it
+# The starting position and the fairy piece rules are not changed, a new piece only reaches the board through
+# from_bytes until the rules place it somewhere
+PIECE_MOVEMENTS = {
+    'Knight': {'jumps': ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))},
+    'Bishop': {'slides': ((1, 1), (-1, 1), (1, -1), (-1, -1))},
+    'Rook': {'slides': ((0, 1), (0, -1), (1, 0), (-1, 0))},
+    'Queen': {'slides': ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1))},
+    'King': {'jumps': ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))},
+    # forward like a bishop, backward like a rook
+    'Falcon': {'slides': ((1, 1), (1, -1), (-1, 0))},
+    # forward like a rook, backward like a bishop
+    'Hunter': {'slides': ((-1, 1), (-1, -1), (1, 0))},
+}
+
+
+def _build_jump_squares(offsets):
+    """returns list of 64 lists, squares on the board reachable from each square with the given (row, col) offsets"""
+    table = []
+    for square in range(64):
+        row, col = square >> 3, square & 7
+        table.append([[row + row_offset, col + col_offset] for row_offset, col_offset in offsets
+                      if 0 <= row + row_offset <= 7 and 0 <= col + col_offset <= 7])
+    return table
+
+
+def _build_ray_squares(row_offset, col_offset):
+    """returns list of 64 lists, squares along one direction from each square, nearest first"""
+    table = []
+    for square in range(64):
+        row, col = square >> 3, square & 7
+        ray = []
+        row += row_offset
+        col += col_offset
+        while 0 <= row <= 7 and 0 <= col <= 7:
+            ray.append([row, col])
+            row += row_offset
+            col += col_offset
+        table.append(ray)
+    return table
+
+
+# vectors of each (piece name, color), then per square tables: jump squares, and one ray per slide vector
+_SLIDE_VECTORS = {}
+_JUMP_VECTORS = {}
+for _piece_name, _movement in PIECE_MOVEMENTS.items():
+    _SLIDE_VECTORS[(_piece_name, 'w')] = tuple(_movement.get('slides', ()))
+    _JUMP_VECTORS[(_piece_name, 'w')] = tuple(_movement.get('jumps', ()))
+    _SLIDE_VECTORS[(_piece_name, 'b')] = tuple(_movement.get(
+        'black_slides', [(-row_offset, col_offset) for row_offset, col_offset in _SLIDE_VECTORS[(_piece_name, 'w')]]))
+    _JUMP_VECTORS[(_piece_name, 'b')] = tuple(_movement.get(
+        'black_jumps', [(-row_offset, col_offset) for row_offset, col_offset in _JUMP_VECTORS[(_piece_name, 'w')]]))
+
+_RAY_SQUARES = {vector: _build_ray_squares(*vector) for vectors in _SLIDE_VECTORS.values() for vector in vectors}
+_JUMP_SQUARES = {key: _build_jump_squares(vectors) for key, vectors in _JUMP_VECTORS.items()}
+_SLIDE_RAYS = {key: [[_RAY_SQUARES[vector][square] for vector in vectors] for square in range(64)]
+               for key, vectors in _SLIDE_VECTORS.items()}
+_PAWN_ATTACK_SQUARES = {'w': _build_jump_squares([(1, 1), (1, -1)]), 'b': _build_jump_squares([(-1, 1), (-1, -1)])}
+
+
+# every piece type in code order
+_PIECE_NAMES = ('Pawn',) + tuple(PIECE_MOVEMENTS)
+# piece types the position format and Zobrist keys started out with, Pawn to Hunter. Types added after them get
+# codes, record bytes and keys of their own, so adding one changes nothing already saved
+_ORIGINAL_PIECE_COUNT = 8
+
+
+# generate_moves packs each move into one int: square moved from in bits 0-5, square moved to in bits 6-11, and
+# for fairy piece entries the piece in bits 12-13 (1 Falcon, 2 Hunter, 0 for normal moves)
+
+_FAIRY_CODES = {'Falcon': 1, 'Hunter': 2}
+_FAIRY_NAMES = (None, 'Falcon', 'Hunter')
+# packed moves are below this, larger values (or fairy codes with no piece) are not moves
+_MOVE_LIMIT = len(_FAIRY_NAMES) << 12
+
+
+# Zobrist keys, seeded so a position hashes the same in every process. The original piece types draw from one
+# stream in the order they always have, each type added after them from a stream seeded with its own name
+_zobrist_random = random.Random(0x5EED)
+_ZOBRIST_PIECES = {}
+_ZOBRIST_RESERVE = {}
+for _color in ('w', 'b'):
+    for _piece_name in _PIECE_NAMES[:_ORIGINAL_PIECE_COUNT]:
+        _ZOBRIST_PIECES[(_color, _piece_name)] = [_zobrist_random.getrandbits(64) for _ in range(64)]
+    for _piece_name in ('Falcon', 'Hunter'):
+        _ZOBRIST_RESERVE[(_color, _piece_name)] = _zobrist_random.getrandbits(64)
+_ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+for _piece_name in _PIECE_NAMES[_ORIGINAL_PIECE_COUNT:]:
+    for _color in ('w', 'b'):
+        _piece_random = random.Random('zobrist %s %s' % (_color, _piece_name))
+        _ZOBRIST_PIECES[(_color, _piece_name)] = [_piece_random.getrandbits(64) for _ in range(64)]
+
+# digest of the original piece types' keys, reserve keys and turn key, see get_hash_fingerprint
+_HASH_FINGERPRINT = _ZOBRIST_BLACK_TO_MOVE
+for _key in ([_key for _color in ('w', 'b') for _piece_name in _PIECE_NAMES[:_ORIGINAL_PIECE_COUNT]
+              for _key in _ZOBRIST_PIECES[(_color, _piece_name)]] + list(_ZOBRIST_RESERVE.values())):
+    _HASH_FINGERPRINT = ((_HASH_FINGERPRINT ^ _key) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+
+
+def get_hash_fingerprint():
+    """returns a 64-bit digest of the Zobrist keys behind get_hash. Files of saved hashes (opening books) store it
+    to check they were made with the same keys, adding a piece type does not change it"""
+    return _HASH_FINGERPRINT
+
+
+def encode_move(from_square, to_square, fairy_piece=None):
+    """returns move packed into one int, squares are row * 8 + col. from_square is ignored when entering a fairy
+    piece"""
+    if fairy_piece is not None:
+        return _FAIRY_CODES[fairy_piece] << 12 | to_square << 6
+    return from_square | to_square << 6
+
+
+def decode_move(move):
+    """returns (from_square, to_square, fairy_piece) for packed move, fairy_piece is None for normal moves. Raises
+    ValueError if move is not a packed move"""
+    if not 0 <= move < _MOVE_LIMIT:
+        raise ValueError('not a packed move: ' + str(move))
+    return move & 63, (move >> 6) & 63, _FAIRY_NAMES[move >> 12]
+
+
+def _parse_square(square):
+    """returns (col, row) indexes of square string such as 'e2', either may be off the board"""
+    # convert letter to column number using ASCII nums, change to 1-8
+    return ord(square[0]) - 97, int(square[1:]) - 1
+
+
+def square_name(square):
+    """returns algebraic name of square index, such as 'e2'"""
+    return chr(97 + (square & 7)) + str((square >> 3) + 1)
+
+
+_SQUARE_INDEXES = {square_name(square): square for square in range(64)}
+
+
+def square_index(square):
+    """returns row * 8 + col for algebraic square such as 'e2', raises ValueError if square is not on the board"""
+    index = _SQUARE_INDEXES.get(square)
+    if index is None:
+        raise ValueError('not a square: ' + str(square))
+    return index
+
+
+def encode_game(moves):
+    """returns array of packed moves for a game log of (square_from, square_to) pairs, with (fairy piece, square_to)
+    for fairy piece entries, e.g. [('e2', 'e4'), ('Falcon', 'e3')]. Parse a log once, then replay it"""
+    packed = array('H')
+    for first, square_to in moves:
+        if first in _FAIRY_CODES:
+            packed.append(_FAIRY_CODES[first] << 12 | _SQUARE_INDEXES[square_to] << 6)
+        else:
+            packed.append(_SQUARE_INDEXES[first] | _SQUARE_INDEXES[square_to] << 6)
+    return packed
+
+
+class MoveCache:
+    """least recently used cache of legal move sets keyed on position hash (ChessVar.get_hash), holds at most
+    max_positions positions. One cache can be shared by many games, a move changes the hash so a game never reads
+    the entry of the position it left. Counts hits, misses and evictions"""
+
+    def __init__(self, max_positions=4096):
+        self._max_positions = max_positions
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, position_hash):
+        """returns cached legal move set for position hash, or None"""
+        legal_moves = self._entries.get(position_hash)
+        if legal_moves is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(position_hash)
+        self._hits += 1
+        return legal_moves
+
+    def put(self, position_hash, legal_moves):
+        """stores legal move set for position hash, dropping the least recently used position if cache is full"""
+        self._entries[position_hash] = legal_moves
+        self._entries.move_to_end(position_hash)
+        if len(self._entries) > self._max_positions:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self):
+        """empties cache, statistics are kept"""
+        self._entries.clear()
+
+    def get_stats(self):
+        """returns dict of positions held, max positions, hits, misses, evictions and hit rate"""
+        lookups = self._hits + self._misses
+        return {'positions': len(self._entries), 'max_positions': self._max_positions, 'hits': self._hits,
+                'misses': self._misses, 'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0}
+
+
+class ChessPiece:
+    """chess piece class, initialize variables and functions needed for all chess pieces. Moves come from the piece's
+    entry in PIECE_MOVEMENTS"""
+
+    __slots__ = ('_current_square', '_color', '_piece_name', '_jump_squares', '_slide_rays')
+
+    def __init__(self, color, piece_name):
+        self._current_square = ''
+        self._color = color
+        self._piece_name = piece_name
+        self._jump_squares = _JUMP_SQUARES.get((piece_name, color))
+        self._slide_rays = _SLIDE_RAYS.get((piece_name, color))
+
+    def get_name(self):
+        """returns name of piece"""
+        return self._piece_name
+
+    def get_current_square(self):
+        """returns square that piece is on"""
+        return self._current_square
+
+    def get_color(self):
+        """returns color of piece"""
+        return self._color
+
+    def check_range(self, to_row, to_col):
+        """helper function if a possible to_Square is out of range"""
+        if to_row > 7 or to_row < 0:
+            return False
+        if to_col > 7 or to_col < 0:
+            return False
+        else:
+            return True
+
+    def piece_move(self, from_col, from_row, board, turn):
+        """passed from_square from valid_move function, returns list of all possible squares piece could move to"""
+
+        possible_squares = []
+        from_square = from_row * 8 + from_col
+
+        # jump squares, already range checked, empty or held by other player
+        for square in self._jump_squares[from_square]:
+            chess_piece = board[square[0]][square[1]]
+            if chess_piece is None or chess_piece.get_color() != turn:
+                possible_squares.append(square)
+
+        # slide along each ray until a piece is reached, include its square if that piece can be captured
+        for ray in self._slide_rays[from_square]:
+            for square in ray:
+                chess_piece = board[square[0]][square[1]]
+                if chess_piece is None:
+                    possible_squares.append(square)
+                else:
+                    if chess_piece.get_color() != turn:
+                        possible_squares.append(square)
+                    break
+
+        return possible_squares
+
+
+class Pawn(ChessPiece):
+    """represents pawn chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Pawn")
+
+    def piece_move(self, from_col, from_row, board, turn):
+        """passed from_square from valid_move function, returns list of all possible squares piece could move to"""
+
+        possible_squares = []           # list of all possible moves
+
+        # determine if pawn is white (bottom of game board)
+        if self._color == 'w':
+
+            if not self.check_range(from_row + 1, from_col + 1):
+                pass
+            else:
+                # if square in front is empty
+                if board[from_row + 1][from_col] is None:
+                    possible_squares.append([from_row + 1, from_col])
+
+            if not self.check_range(from_row + 1, from_col + 1):
+                pass
+            else:
+                # determine if enemy piece in upper right
+                if board[from_row + 1][from_col + 1] is not None:
+                    upper_right = board[from_row + 1][from_col + 1]
+                    if upper_right.get_color() != self.get_color():
+                        possible_squares.append([from_row + 1, from_col + 1])
+
+            if not self.check_range(from_row + 1, from_col - 1):
+                pass
+            else:
+                # determine if enemy piece upper left
+                if board[from_row + 1][from_col - 1] is not None:
+                    upper_left = board[from_row + 1][from_col - 1]
+                    if upper_left.get_color() != self.get_color():
+                        possible_squares.append([from_row + 1, from_col - 1])
+
+            # determine if pawn is in starting position, thus gets to move up 2 spaces (if no piece there)
+            if not self.check_range(from_row + 2, from_col):
+                pass
+            elif board[from_row + 2][from_col] is None:
+                possible_squares.append([from_row + 2, from_col])
+            else:
+                pass
+
+        # determine if pawn is black (top of game board)
+        if self._color == 'b':
+
+            # if square in front is empty, moves on if square is out of bounds
+            if not self.check_range(from_row - 1, from_col):
+                pass
+            else:
+                if board[from_row - 1][from_col] is None:
+                    possible_squares.append([from_row - 1, from_col])
+
+            # determine if enemy piece in upper right, moves on if square is out of bounds
+            if not self.check_range(from_row - 1, from_col + 1):
+                pass
+            else:
+                if (board[from_row - 1][from_col + 1]) is not None:
+                    bottom_right = board[from_row - 1][from_col + 1]
+                    if bottom_right.get_color() != self.get_color():
+                        possible_squares.append([from_row - 1, from_col + 1])
+
+            # determine if enemy piece upper left, moves on if square is out of bounds
+            if not self.check_range(from_row - 1, from_col - 1):
+                pass
+            else:
+                if board[from_row - 1][from_col - 1] is not None:
+                    bottom_left = board[from_row - 1][from_col - 1]
+                    if bottom_left.get_color() != self.get_color():
+                        possible_squares.append([from_row - 1, from_col - 1])
+
+            # determine if pawn is in starting position, thus gets to move down 2 spaces (and no piece there)
+            if from_row == 6:
+                if board[from_row - 2][from_col] is None:
+                    possible_squares.append([from_row - 2, from_col])
+                else:
+                    pass
+
+        # return list of all possible square moves
+        return possible_squares
+
+
+class Knight(ChessPiece):
+    """represents Knight chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Knight")
+
+
+class Bishop(ChessPiece):
+    """represents Bishop chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Bishop")
+
+
+class King(ChessPiece):
+    """represents King chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "King")
+
+
+class Rook(ChessPiece):
+    """represents rook chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Rook")
+
+
+class Queen(ChessPiece):
+    """represents Queen chess piece, inherits from ChessPiece class, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Queen")
+
+
+class Falcon(ChessPiece):
+    """represents Falcon Fairy piece, inherits from ChessPiece, color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Falcon")
+
+
+class Hunter(ChessPiece):
+    """represents Hunter Fairy piece, inherits from ChessPiece , color and name specific attributes"""
+
+    __slots__ = ()
+
+    def __init__(self, color):
+        super().__init__(color, "Hunter")
+
+
+# bitboard backend: square index is row * 8 + col, so bit 0 is a1 and bit 63 is h8
+
+def _bb_mask(squares):
+    """returns bitboard with a bit set for each [row, col] in squares"""
+    mask = 0
+    for row, col in squares:
+        mask |= 1 << (row * 8 + col)
+    return mask
+
+
+# one shared instance of each piece type and color, used for every piece ChessVar puts on the board. A piece type
+# with a ChessPiece subclass of its own name is made from it, any other is a plain ChessPiece moving by its vectors
+_PIECE_CLASSES = {piece_class.__name__: piece_class for piece_class in ChessPiece.__subclasses__()}
+_PIECES = {}
+for _piece_name in _PIECE_NAMES:
+    for _color in ('w', 'b'):
+        if _piece_name in _PIECE_CLASSES:
+            _PIECES[(_piece_name, _color)] = _PIECE_CLASSES[_piece_name](_color)
+        else:
+            _PIECES[(_piece_name, _color)] = ChessPiece(_color, _piece_name)
+
+
+def get_piece(piece_name, color):
+    """returns shared piece instance for piece name ('Pawn' ... 'Hunter') and color ('w' or 'b')"""
+    return _PIECES[(piece_name, color)]
+
+
+def get_piece_names():
+    """returns tuple of every piece type name, in position format code order"""
+    return _PIECE_NAMES
+
+
+def get_piece_vectors(piece_name, color):
+    """returns (slide vectors, jump vectors) of piece name and color, each a tuple of (row, col) offsets (see
+    PIECE_MOVEMENTS). Both are empty for the Pawn, whose moves are not vectors"""
+    return _SLIDE_VECTORS.get((piece_name, color), ()), _JUMP_VECTORS.get((piece_name, color), ())
+
+
+# fixed size position layout used by ChessVar.pack_into and ChessVar.from_bytes: format version, 64 squares, turn,
+# game state, a lost piece count for each original piece type (white then black), reserve bits, then a white and a
+# black lost count for each piece type added after the original ones. The original types have codes 1-8 for white
+# and 9-16 for black, each added type the next two codes (white, black). Adding a type appends its codes and
+# counts, renumbering nothing, and moves the format up one version: from_bytes still reads records of earlier
+# versions, with the counts they do not hold at 0
+POSITION_FORMAT_VERSION = 1 + len(_PIECE_NAMES) - _ORIGINAL_PIECE_COUNT
+POSITION_SQUARES_OFFSET = 1
+POSITION_TURN_OFFSET = POSITION_SQUARES_OFFSET + 64
+POSITION_GAME_STATE_OFFSET = POSITION_TURN_OFFSET + 1
+POSITION_LOST_PIECES_OFFSET = POSITION_GAME_STATE_OFFSET + 1
+POSITION_RESERVE_OFFSET = POSITION_LOST_PIECES_OFFSET + 2 * _ORIGINAL_PIECE_COUNT
+POSITION_SIZE = POSITION_RESERVE_OFFSET + 1 + 2 * (POSITION_FORMAT_VERSION - 1)
+_PIECE_CODES = {}
+_CODE_PIECES = [None] * (2 * len(_PIECE_NAMES) + 1)
+# (piece name, white count offset, black count offset, first format version holding them) for each piece type
+_LOST_PIECE_OFFSETS = []
+for _index, _piece_name in enumerate(_PIECE_NAMES):
+    if _index < _ORIGINAL_PIECE_COUNT:
+        _codes = (_index + 1, _index + 1 + _ORIGINAL_PIECE_COUNT)
+        _lost = (POSITION_LOST_PIECES_OFFSET + _index, POSITION_LOST_PIECES_OFFSET + _ORIGINAL_PIECE_COUNT + _index, 1)
+    else:
+        _codes = (2 * _index + 1, 2 * _index + 2)
+        _added = _index - _ORIGINAL_PIECE_COUNT
+        _lost = (POSITION_RESERVE_OFFSET + 1 + 2 * _added, POSITION_RESERVE_OFFSET + 2 + 2 * _added, 2 + _added)
+    for _color, _code in zip(('w', 'b'), _codes):
+        _PIECE_CODES[(_piece_name, _color)] = _code
+        _CODE_PIECES[_code] = _PIECES[(_piece_name, _color)]
+    _LOST_PIECE_OFFSETS.append((_piece_name,) + _lost)
+_TURN_CODES = {'w': 0, 'b': 1}
+_TURN_NAMES = ('w', 'b')
+_GAME_STATE_CODES = {'UNFINISHED': 0, 'WHITE_WON': 1, 'BLACK_WON': 2}
+_GAME_STATE_NAMES = ('UNFINISHED', 'WHITE_WON', 'BLACK_WON')
+_RESERVE_BITS = {('w', 'Falcon'): 1, ('w', 'Hunter'): 2, ('b', 'Falcon'): 4, ('b', 'Hunter'): 8}
+
+
+def get_piece_code(piece_name, color):
+    """returns position format code (1 and up) of piece name and color, as stored in a record's square bytes"""
+    return _PIECE_CODES[(piece_name, color)]
+
+
+def get_turn_code(color):
+    """returns position format turn byte for color to move"""
+    return _TURN_CODES[color]
+
+
+def get_reserve_bit(piece_name, color):
+    """returns bit set in a position record's reserve byte while color still holds fairy piece piece_name"""
+    return _RESERVE_BITS[(color, piece_name)]
+
+
+# bitboard index (position format piece code) of each shared piece instance
+_BB_PIECE_INDEXES = {piece: code for code, piece in enumerate(_CODE_PIECES) if piece is not None}
+
+# move tables of each shared piece instance for BitboardChessVar, looked up by the piece itself so move generation
+# does one dict lookup per piece: (color, other color, jump bitboard per square, slides per square). Slides are one
+# (ray bitboard, that ray's bitboards from every square, nearest blocker is lowest bit) entry per slide vector.
+# Pawns have None for jumps and a (step bitboard, capture bitboard) per square instead of slides, with the range
+# checks of Pawn.piece_move already applied
+_BB_RAYS = {vector: [_bb_mask(ray) for ray in rays] for vector, rays in _RAY_SQUARES.items()}
+_BB_MOVES = {}
+for (_piece_name, _color), _piece in _PIECES.items():
+    _other_color = 'b' if _color == 'w' else 'w'
+    if _piece_name != 'Pawn':
+        _BB_MOVES[_piece] = (
+            _color, _other_color, [_bb_mask(squares) for squares in _JUMP_SQUARES[(_piece_name, _color)]],
+            [tuple((_BB_RAYS[vector][square], _BB_RAYS[vector], vector[0] * 8 + vector[1] > 0)
+                   for vector in _SLIDE_VECTORS[(_piece_name, _color)]) for square in range(64)])
+        continue
+
+    _pawn_squares = []
+    for _square in range(64):
+        _row, _col = _square >> 3, _square & 7
+        _steps = 0
+        # Pawn.piece_move range checks the square up and right before a white pawn's single step, and checks
+        # neither the square in between nor (for white) the starting row before a double step
+        if _color == 'w':
+            if _row < 7 and _col < 7:
+                _steps |= 1 << (_square + 8)
+            if _row < 6:
+                _steps |= 1 << (_square + 16)
+        else:
+            if _row > 0:
+                _steps |= 1 << (_square - 8)
+            if _row == 6:
+                _steps |= 1 << (_square - 16)
+        _pawn_squares.append((_steps, _bb_mask(_PAWN_ATTACK_SQUARES[_color][_square])))
+    _BB_MOVES[_piece] = (_color, _other_color, None, _pawn_squares)
+
+
+class BitboardChessVar(ChessVar):
+    """ChessVar that stores the board as 64-bit bitboards, one per piece type and color, same rules as ChessVar
+    piece objects are also kept in a 64 square list so looking up the piece on a square stays cheap"""
+
+    def get_board(self):
+        """returns current state of chess board as 8x8 list of pieces, built from the bitboards"""
+        return [self._squares[row * 8:row * 8 + 8] for row in range(8)]
+
+    def get_bitboard(self, color, piece_name):
+        """returns bitboard of squares holding given color's piece type"""
+        return self._bitboards[_PIECE_CODES[(piece_name, color)]]
+
+    def valid_move(self, from_col, from_row, to_col, to_row):
+        """same checks as ChessVar.valid_move, but tests the to square against a bitboard of target squares"""
+
+        # answer from position's legal moves if a move cache is set
+        if self._move_cache is not None:
+            return self._cached_valid_move(from_col, from_row, to_col, to_row)
+
+        # return False if game is won
+        if self._game_state != 'UNFINISHED':
+            return False
+
+        # return False if either square is out of bounds
+        if not 0 <= from_col <= 7 or not 0 <= from_row <= 7:
+            return False
+        if not 0 <= to_col <= 7 or not 0 <= to_row <= 7:
+            return False
+
+        from_square = from_row * 8 + from_col
+        chess_piece = self._squares[from_square]
+
+        # return False if square_from is empty or does not have current player's piece
+        if chess_piece is None or chess_piece.get_color() != self._turn:
+            return False
+
+        # target bitboard never includes squares with current player's pieces on them
+        if self._profiler is None:
+            targets = self._target_mask(from_square, chess_piece)
+        else:
+            start = time.perf_counter()
+            targets = self._target_mask(from_square, chess_piece)
+            self._profiler.record('piece_move', time.perf_counter() - start)
+        return (targets >> (to_row * 8 + to_col)) & 1 == 1
+
+    def generate_moves(self):
+        """returns array of every legal move for current player, same moves as ChessVar.generate_moves, read from
+        target bitboards"""
+        moves = array('H')
+        if self._game_state != 'UNFINISHED':
+            return moves
+
+        squares = self._squares
+        target_mask = self._target_mask
+        for from_square in sorted(self._piece_squares[self._turn]):
+            targets = target_mask(from_square, squares[from_square])
+            while targets:
+                to_bit = targets & -targets
+                targets ^= to_bit
+                moves.append(from_square | (to_bit.bit_length() - 1) << 6)
+
+        self._add_fairy_moves(moves)
+        return moves
+
+    def _target_mask(self, square, chess_piece):
+        """returns bitboard of all squares piece on square could move to"""
+        color, other_color, jumps, slides = _BB_MOVES[chess_piece]
+        own = self._occupied[color]
+        enemy = self._occupied[other_color]
+
+        if jumps is None:
+            # pawn: steps onto empty squares, captures onto enemy ones
+            steps, captures = slides[square]
+            return steps & ~(own | enemy) | captures & enemy
+
+        targets = jumps[square]
+        all_pieces = own | enemy
+        for ray, rays, positive in slides[square]:
+            # cut the ray off after the nearest blocker, which stays in as a possible capture
+            blockers = ray & all_pieces
+            if blockers:
+                if positive:
+                    ray ^= rays[(blockers & -blockers).bit_length() - 1]
+                else:
+                    ray ^= rays[blockers.bit_length() - 1]
+            targets |= ray
+        return targets & ~own
+
+    def _clear_board(self):
+        """sets up empty bitboards, board is kept in them instead of the list board"""
+        # bitboards indexed by position format piece code (see _PIECE_CODES), index 0 unused
+        self._bitboards = [0] * len(_CODE_PIECES)
+        self._occupied = {'w': 0, 'b': 0}
+        self._squares = [None] * 64
+        self._board = None
+
+    def _piece_at(self, row, col):
+        """returns piece on given square, or None if square is empty"""
+        return self._squares[row * 8 + col]
+
+    def _move_piece(self, from_row, from_col, to_row, to_col):
+        """moves piece on from square to to square, returns piece that was captured (None if square was empty)"""
+        from_square = from_row * 8 + from_col
+        to_square = to_row * 8 + to_col
+        squares = self._squares
+        chess_piece = squares[from_square]
+        captured_piece = squares[to_square]
+
+        if captured_piece is not None:
+            self._remove_bit(captured_piece, to_square)
+        move_bits = 1 << from_square | 1 << to_square
+        self._bitboards[_BB_PIECE_INDEXES[chess_piece]] ^= move_bits
+        self._occupied[chess_piece.get_color()] ^= move_bits
+
+        squares[to_square] = chess_piece
+        squares[from_square] = None
+        return captured_piece
+
+    def _place_piece(self, row, col, piece):
+        """puts piece on given (empty) square, used when entering fairy pieces"""
+        square = row * 8 + col
+        self._add_bit(piece, square)
+        self._squares[square] = piece
+
+    def _remove_piece(self, row, col):
+        """takes piece off given square, used when taking back a fairy piece entry"""
+        square = row * 8 + col
+        self._remove_bit(self._squares[square], square)
+        self._squares[square] = None
+
+    def _add_bit(self, piece, square):
+        """sets square's bit in piece's bitboard and its color's occupancy"""
+        self._bitboards[_BB_PIECE_INDEXES[piece]] |= 1 << square
+        self._occupied[piece.get_color()] |= 1 << square
+
+    def _remove_bit(self, piece, square):
+        """clears square's bit in piece's bitboard and its color's occupancy"""
+        self._bitboards[_BB_PIECE_INDEXES[piece]] &= ~(1 << square)
+        self._occupied[piece.get_color()] &= ~(1 << square)
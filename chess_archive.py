@@ -0,0 +1,44 @@
+# Description: compact on-disk archive of ChessVar games. Each game is a record of its result code, move count and
+# packed moves (see ChessVar.encode_move), read back one game at a time so archives never have to fit in memory
+
+import struct
+import sys
+from array import array
+
+_GAME_HEADER = struct.Struct('<BH')
+
+RESULT_CODES = {'UNFINISHED': 0, 'WHITE_WON': 1, 'BLACK_WON': 2}
+RESULT_NAMES = ('UNFINISHED', 'WHITE_WON', 'BLACK_WON')
+
+
+def write_game(file, moves, result='UNFINISHED'):
+    """appends one game to binary file object: result ('UNFINISHED', 'WHITE_WON', 'BLACK_WON') and packed moves"""
+    moves = array('H', moves)
+    file.write(_GAME_HEADER.pack(RESULT_CODES[result], len(moves)))
+    if sys.byteorder == 'big':
+        moves.byteswap()
+    file.write(moves.tobytes())
+
+
+def read_games(file):
+    """yields (result, array of packed moves) for each game in binary file object or path, one at a time"""
+    if isinstance(file, str):
+        with open(file, 'rb') as archive:
+            yield from read_games(archive)
+        return
+
+    while True:
+        header = file.read(_GAME_HEADER.size)
+        if not header:
+            return
+        if len(header) < _GAME_HEADER.size:
+            raise ValueError('archive ends in the middle of a game')
+        result, count = _GAME_HEADER.unpack(header)
+        moves = array('H')
+        data = file.read(count * 2)
+        if len(data) < count * 2:
+            raise ValueError('archive ends in the middle of a game')
+        moves.frombytes(data)
+        if sys.byteorder == 'big':
+            moves.byteswap()
+        yield RESULT_NAMES[result], moves
@@ -0,0 +1,126 @@
+# Description: checks one candidate move for each of many ChessVar positions at once with NumPy. Boards are held as
+# an int8 array of shape (N, 8, 8): 0 for empty, piece number for white and minus piece number for black (see
+# PIECE_CODES). Pawn rules are written out here, every other piece moves by its ChessVar movement vectors (see
+# ChessVar.PIECE_MOVEMENTS), so pieces added there are covered too. Fairy piece entries are not covered
+
+import numpy as np
+
+from ChessVar import get_piece_names, get_piece_vectors
+
+PIECE_CODES = {}
+for _number, _piece_name in enumerate(get_piece_names(), 1):
+    PIECE_CODES[(_piece_name, 'w')] = _number
+    PIECE_CODES[(_piece_name, 'b')] = -_number
+
+PAWN = PIECE_CODES[('Pawn', 'w')]
+
+# move vectors of every piece type but the Pawn, looked up by [black, piece number, row step + 7, col step + 7]:
+# the vector a move repeats and how many times, 0 times if the piece cannot make the move. A jump is one step of its
+# vector, so it has no squares in between to check. Built once here so validate does one lookup for every piece
+_VECTOR_ROWS = np.zeros((2, len(get_piece_names()) + 1, 15, 15), dtype=np.int64)
+_VECTOR_COLS = np.zeros_like(_VECTOR_ROWS)
+_VECTOR_STEPS = np.zeros_like(_VECTOR_ROWS)
+for _black, _color in enumerate(('w', 'b')):
+    for _piece_name in get_piece_names():
+        _number = PIECE_CODES[(_piece_name, 'w')]
+        _slides, _jumps = get_piece_vectors(_piece_name, _color)
+        # jumps last, so a move a piece can both jump and slide to is never blocked
+        for _vector, _max_steps in [(_vector, 7) for _vector in _slides] + [(_vector, 1) for _vector in _jumps]:
+            for _steps in range(1, _max_steps + 1):
+                _row_step, _col_step = _vector[0] * _steps, _vector[1] * _steps
+                if abs(_row_step) > 7 or abs(_col_step) > 7:
+                    break
+                _VECTOR_ROWS[_black, _number, _row_step + 7, _col_step + 7] = _vector[0]
+                _VECTOR_COLS[_black, _number, _row_step + 7, _col_step + 7] = _vector[1]
+                _VECTOR_STEPS[_black, _number, _row_step + 7, _col_step + 7] = _steps
+
+
+class BoardBatch:
+    """N positions: boards (N, 8, 8) int8 indexed [game, row, col], turns (N,) int8 with 1 for white and -1 for
+    black to move, finished (N,) bool for games already won"""
+
+    def __init__(self, boards, turns, finished=None):
+        self._boards = np.ascontiguousarray(boards, dtype=np.int8)
+        self._turns = np.asarray(turns, dtype=np.int8)
+        if finished is None:
+            finished = np.zeros(len(self._boards), dtype=bool)
+        self._finished = np.asarray(finished, dtype=bool)
+
+    @classmethod
+    def from_games(cls, games):
+        """returns batch holding current position of each ChessVar in games"""
+        games = list(games)
+        batch = cls(np.zeros((len(games), 8, 8), dtype=np.int8), np.ones(len(games), dtype=np.int8))
+        for index, game in enumerate(games):
+            batch.set_game(index, game)
+        return batch
+
+    def get_boards(self):
+        """returns (N, 8, 8) int8 board array"""
+        return self._boards
+
+    def get_size(self):
+        """returns number of positions in batch"""
+        return len(self._boards)
+
+    def set_game(self, index, game):
+        """copies ChessVar's current position into slot index"""
+        codes = bytearray(64)
+        for square in range(64):
+            chess_piece = game.get_piece_on(square)
+            if chess_piece is not None:
+                codes[square] = PIECE_CODES[(chess_piece.get_name(), chess_piece.get_color())] & 0xFF
+        self._boards[index] = np.frombuffer(codes, dtype=np.int8).reshape(8, 8)
+        self._turns[index] = 1 if game.get_turn() == 'w' else -1
+        self._finished[index] = game.get_game_state() != 'UNFINISHED'
+
+    def validate(self, moves):
+        """returns bool array, entry i is True if packed move i (see ChessVar.encode_move) is legal for position i,
+        the same answer ChessVar.valid_move gives. Fairy piece entries are always False"""
+        moves = np.asarray(moves, dtype=np.int64)
+        games = np.arange(len(moves))
+        from_row, from_col = (moves >> 3) & 7, moves & 7
+        to_row, to_col = (moves >> 9) & 7, (moves >> 6) & 7
+        boards = self._boards
+        sign = self._turns.astype(np.int64)
+
+        chess_piece = boards[games, from_row, from_col].astype(np.int64) * sign
+        target = boards[games, to_row, to_col].astype(np.int64) * sign
+        kind = chess_piece
+        white = sign > 0
+
+        row_step = to_row - from_row
+        col_step = to_col - from_col
+        col_distance = np.abs(col_step)
+
+        # own piece on from square, to square empty or enemy, normal move, game not won
+        legal = (chess_piece > 0) & (target <= 0) & ((moves >> 12) == 0) & ~self._finished
+
+        # jumps and slides from the vector tables, then every square before the to square must be empty
+        vector = (~white).astype(np.int64), np.maximum(kind, 0), row_step + 7, col_step + 7
+        steps = _VECTOR_STEPS[vector]
+        vector_move = (steps > 0) & ~self._blocked(games, from_row, from_col, _VECTOR_ROWS[vector],
+                                                   _VECTOR_COLS[vector], steps)
+
+        # pawns, same squares Pawn.piece_move allows, including its range check on the square up and right for a
+        # white pawn's single step and no in-between check on the double step
+        forward = np.where(white, row_step, -row_step)
+        pawn = (col_step == 0) & (forward == 1) & (target == 0) & (~white | (from_col < 7))
+        pawn |= (col_distance == 1) & (forward == 1) & (target < 0)
+        pawn |= (col_step == 0) & (forward == 2) & (target == 0) & (white | (from_row == 6))
+        pawn &= kind == PAWN
+
+        return legal & (vector_move | pawn)
+
+    def _blocked(self, games, from_row, from_col, row_offsets, col_offsets, steps):
+        """returns bool array, True where a square passed over before the last of steps moves by (row_offsets,
+        col_offsets) from the from square is occupied"""
+        blocked = np.zeros(len(games), dtype=bool)
+        for step in range(1, 8):
+            between = step < steps
+            if not between.any():
+                break
+            rows = np.clip(from_row + row_offsets * step, 0, 7)
+            cols = np.clip(from_col + col_offsets * step, 0, 7)
+            blocked |= between & (self._boards[games, rows, cols] != 0)
+        return blocked
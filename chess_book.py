@@ -0,0 +1,143 @@
+# Description: opening book for ChessVar. The book file is a sorted list of (position hash, move, weight) records,
+# opened with mmap and searched with binary search so lookups do not load the book into memory. The header holds
+# ChessVar.get_hash_fingerprint() so a book built with other hash keys is refused instead of silently missing.
+# Build: python chess_book.py build ARCHIVE BOOK [--max-ply N] [--min-count N]
+# Probe: python chess_book.py probe BOOK
+
+import argparse
+import mmap
+import random
+import struct
+
+from ChessVar import ChessVar, get_hash_fingerprint
+from chess_archive import read_games
+
+# magic, version, entry count, then for version 2 on the hash key fingerprint. Version 1 books have no fingerprint,
+# they were built with the keys of the original piece types, which have not changed since
+_HEADER = struct.Struct('<6sHI')
+_FINGERPRINT = struct.Struct('<Q')
+_ENTRY = struct.Struct('<QHH')
+BOOK_MAGIC = b'CVBOOK'
+BOOK_VERSION = 2
+
+
+class OpeningBook:
+    """read-only, memory mapped opening book. Use as a context manager or call close()"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap cannot map an empty file
+            self._file.close()
+            raise ValueError(path + ' is not an opening book')
+        magic, version, self._size = b'', 0, 0
+        if len(self._map) >= _HEADER.size:
+            magic, version, self._size = _HEADER.unpack_from(self._map, 0)
+        if magic != BOOK_MAGIC or version not in (1, BOOK_VERSION):
+            self.close()
+            raise ValueError(path + ' is not an opening book')
+        self._entries_offset = _HEADER.size if version == 1 else _HEADER.size + _FINGERPRINT.size
+        if len(self._map) != self._entries_offset + self._size * _ENTRY.size:
+            self.close()
+            raise ValueError(path + ' is truncated')
+        if version > 1 and _FINGERPRINT.unpack_from(self._map, _HEADER.size)[0] != get_hash_fingerprint():
+            self.close()
+            raise ValueError(path + ' was built with other position hash keys')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """unmaps and closes book file"""
+        self._map.close()
+        self._file.close()
+
+    def get_size(self):
+        """returns number of (position, move) entries in book"""
+        return self._size
+
+    def lookup(self, position_hash):
+        """returns list of (move, weight) stored for position hash (see ChessVar.get_hash), empty if none"""
+        low = 0
+        high = self._size
+        while low < high:
+            middle = (low + high) // 2
+            if _ENTRY.unpack_from(self._map, self._entries_offset + middle * _ENTRY.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        while low < self._size:
+            entry_hash, move, weight = _ENTRY.unpack_from(self._map, self._entries_offset + low * _ENTRY.size)
+            if entry_hash != position_hash:
+                break
+            moves.append((move, weight))
+            low += 1
+        return moves
+
+    def choose(self, game, rng=random):
+        """returns a book move for game's position picked at random by weight, or None if position is not in book.
+        Moves that are not legal in the position (hash collisions) are skipped"""
+        legal = set(game.generate_moves())
+        moves = [(move, weight) for move, weight in self.lookup(game.get_hash()) if move in legal]
+        if not moves:
+            return None
+        return rng.choices([move for move, weight in moves], weights=[weight for move, weight in moves])[0]
+
+
+def build_book(games, path, max_ply=16, min_count=1):
+    """writes book file to path from games (iterable of packed move sequences), counting how often each move was
+    played from each position in the first max_ply moves. Moves seen fewer than min_count times are left out.
+    Returns number of entries written"""
+    counts = {}
+    for moves in games:
+        game = ChessVar()
+        for ply, move in enumerate(moves):
+            if ply >= max_ply:
+                break
+            position_hash = game.get_hash()
+            if not game.push_move(move):
+                break
+            key = (position_hash, move)
+            counts[key] = counts.get(key, 0) + 1
+
+    entries = sorted((position_hash, move, min(count, 0xFFFF))
+                     for (position_hash, move), count in counts.items() if count >= min_count)
+    with open(path, 'wb') as book:
+        book.write(_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, len(entries)))
+        book.write(_FINGERPRINT.pack(get_hash_fingerprint()))
+        for entry in entries:
+            book.write(_ENTRY.pack(*entry))
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar opening book')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build book from a chess_archive game file')
+    build.add_argument('archive')
+    build.add_argument('book')
+    build.add_argument('--max-ply', type=int, default=16)
+    build.add_argument('--min-count', type=int, default=1)
+    probe = commands.add_parser('probe', help='print book moves for the starting position')
+    probe.add_argument('book')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        games = (moves for result, moves in read_games(args.archive))
+        print(build_book(games, args.book, args.max_ply, args.min_count), 'entries written')
+    else:
+        from chess_perft import move_text
+        with OpeningBook(args.book) as book:
+            for move, weight in book.lookup(ChessVar().get_hash()):
+                print(move_text(move), weight)
+
+
+if __name__ == '__main__':
+    main()
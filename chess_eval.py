@@ -0,0 +1,204 @@
+# Description: static evaluation of ChessVar positions, material plus piece-square terms. Fairy pieces still in
+# reserve count for part of their value since they can only come in once a Queen, Knight or Bishop is lost.
+# Scores are kept up to date by the game on every move and pop_move (ChessVar.enable_evaluation), and many positions
+# packed with ChessVar.pack_into can be scored at once for labelling
+
+from array import array
+
+from ChessVar import (POSITION_RESERVE_OFFSET, POSITION_SIZE, POSITION_SQUARES_OFFSET, POSITION_TURN_OFFSET,
+                      get_piece_code, get_piece_names, get_reserve_bit, get_turn_code)
+
+PIECE_VALUES = {
+    'Pawn': 100,
+    'Knight': 300,
+    'Bishop': 320,
+    'Rook': 500,
+    'Queen': 900,
+    'King': 0,
+    'Falcon': 350,
+    'Hunter': 350,
+}
+
+# fairy piece sitting in reserve, worth less than on the board since it may never be entered
+RESERVE_VALUES = {
+    'Falcon': 150,
+    'Hunter': 150,
+}
+
+# bonus for a white piece on each square, rows listed from white's back row (row 1) up to row 8,
+# black uses the same tables mirrored top to bottom
+PIECE_SQUARE_TABLES = {
+    'Pawn': [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [5, 10, 10, -20, -20, 10, 10, 5],
+        [5, -5, -10, 0, 0, -10, -5, 5],
+        [0, 0, 0, 20, 20, 0, 0, 0],
+        [5, 5, 10, 25, 25, 10, 5, 5],
+        [10, 10, 20, 30, 30, 20, 10, 10],
+        [50, 50, 50, 50, 50, 50, 50, 50],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ],
+    'Knight': [
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+        [-40, -20, 0, 5, 5, 0, -20, -40],
+        [-30, 5, 10, 15, 15, 10, 5, -30],
+        [-30, 0, 15, 20, 20, 15, 0, -30],
+        [-30, 5, 15, 20, 20, 15, 5, -30],
+        [-30, 0, 10, 15, 15, 10, 0, -30],
+        [-40, -20, 0, 0, 0, 0, -20, -40],
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+    ],
+    'Bishop': [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 5, 0, 0, 0, 0, 5, -10],
+        [-10, 10, 10, 10, 10, 10, 10, -10],
+        [-10, 0, 10, 10, 10, 10, 0, -10],
+        [-10, 5, 5, 10, 10, 5, 5, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+    ],
+    'Rook': [
+        [0, 0, 0, 5, 5, 0, 0, 0],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [5, 10, 10, 10, 10, 10, 10, 5],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ],
+    'Queen': [
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+        [-10, 0, 5, 0, 0, 0, 0, -10],
+        [-10, 5, 5, 5, 5, 5, 0, -10],
+        [0, 0, 5, 5, 5, 5, 0, -5],
+        [-5, 0, 5, 5, 5, 5, 0, -5],
+        [-10, 0, 5, 5, 5, 5, 0, -10],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+    ],
+    'King': [
+        [20, 30, 10, 0, 0, 10, 30, 20],
+        [20, 20, 0, 0, 0, 0, 20, 20],
+        [-10, -20, -20, -20, -20, -20, -20, -10],
+        [-20, -30, -30, -40, -40, -30, -30, -20],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+    ],
+    # Falcon moves forward like a bishop and back like a rook, Hunter the other way round: both do best centrally
+    'Falcon': [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 5, 10, 15, 15, 10, 5, -10],
+        [-10, 5, 10, 15, 15, 10, 5, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+    ],
+    'Hunter': [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 5, 10, 15, 15, 10, 5, -10],
+        [-10, 5, 10, 15, 15, 10, 5, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+    ],
+}
+
+
+class Evaluator:
+    """scores ChessVar positions in centipawns from the point of view of the player to move. Tables default to
+    PIECE_VALUES, RESERVE_VALUES and PIECE_SQUARE_TABLES, any of them can be replaced"""
+
+    def __init__(self, piece_values=None, reserve_values=None, piece_square_tables=None):
+        piece_values = PIECE_VALUES if piece_values is None else piece_values
+        reserve_values = RESERVE_VALUES if reserve_values is None else reserve_values
+        piece_square_tables = PIECE_SQUARE_TABLES if piece_square_tables is None else piece_square_tables
+
+        # score for white of each piece on each square, black's negative and mirrored
+        self._square_scores = {}
+        for piece_name, value in piece_values.items():
+            table = piece_square_tables.get(piece_name)
+            white_scores = [value + (table[square >> 3][square & 7] if table else 0) for square in range(64)]
+            self._square_scores[('w', piece_name)] = white_scores
+            self._square_scores[('b', piece_name)] = [-white_scores[square ^ 56] for square in range(64)]
+
+        self._reserve_scores = {}
+        for piece_name, value in reserve_values.items():
+            self._reserve_scores[('w', piece_name)] = value
+            self._reserve_scores[('b', piece_name)] = -value
+
+        # same tables looked up by position format codes, for evaluate_positions
+        self._code_scores = {}
+        for piece_name in get_piece_names():
+            for color in ('w', 'b'):
+                self._code_scores[get_piece_code(piece_name, color)] = self._square_scores[(color, piece_name)]
+        self._reserve_bit_scores = [0] * 16
+        for reserve in range(16):
+            for (color, piece_name), score in self._reserve_scores.items():
+                if reserve & get_reserve_bit(piece_name, color):
+                    self._reserve_bit_scores[reserve] += score
+        self._black_to_move = get_turn_code('b')
+
+    def get_square_scores(self):
+        """returns dict of score for white of each (color, piece name) on each square index"""
+        return self._square_scores
+
+    def get_reserve_scores(self):
+        """returns dict of score for white of each (color, fairy piece name) held in reserve"""
+        return self._reserve_scores
+
+    def attach(self, game):
+        """turns on game's running score with this evaluator's tables, from then on moves and pop_move keep it up to
+        date. A game keeping a score with other tables (another evaluator's) is switched to this evaluator's and its
+        score is rebuilt"""
+        if not self._is_attached(game):
+            game.enable_evaluation(self._square_scores, self._reserve_scores)
+
+    def evaluate(self, game):
+        """returns score of game's position for player whose turn it is. Reads game's running score if game is
+        attached to this evaluator, else scores its packed position, game is not changed either way. Attach games
+        that are scored after every move"""
+        if not self._is_attached(game):
+            return self.evaluate_batch((game,))[0]
+        score = game.get_score()
+        if game.get_turn() == 'w':
+            return score
+        return -score
+
+    def _is_attached(self, game):
+        """returns True if game keeps its running score with this evaluator's own tables"""
+        tables = game.get_evaluation_tables()
+        return tables is not None and tables[0] is self._square_scores and tables[1] is self._reserve_scores
+
+    def evaluate_positions(self, data):
+        """returns array of scores for player to move of every position in data, a bytes-like object holding
+        positions back to back in the ChessVar.pack_into format"""
+        view = memoryview(data)
+        code_scores = self._code_scores
+        scores = array('i', bytes(4 * (len(view) // POSITION_SIZE)))
+        for index, offset in enumerate(range(0, len(view) - POSITION_SIZE + 1, POSITION_SIZE)):
+            score = self._reserve_bit_scores[view[offset + POSITION_RESERVE_OFFSET] & 15]
+            squares = offset + POSITION_SQUARES_OFFSET
+            for square, code in enumerate(view[squares:squares + 64]):
+                if code:
+                    score += code_scores[code][square]
+            if view[offset + POSITION_TURN_OFFSET] == self._black_to_move:
+                score = -score
+            scores[index] = score
+        return scores
+
+    def evaluate_batch(self, games):
+        """returns array of scores for player to move of every ChessVar in games, games are packed into one buffer
+        and scored with evaluate_positions so their own running scores are not touched"""
+        games = list(games)
+        buffer = bytearray(POSITION_SIZE * len(games))
+        for index, game in enumerate(games):
+            game.pack_into(buffer, index * POSITION_SIZE)
+        return self.evaluate_positions(buffer)
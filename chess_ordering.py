@@ -0,0 +1,119 @@
+# Description: move ordering for alpha-beta search of ChessVar. Legal moves are put in the order most likely to cause
+# a cutoff: the transposition table move, captures by most valuable victim / least valuable attacker (king captures
+# first since they end the game), killer moves that cut off at the same ply, then quiet moves by history score
+
+from chess_eval import PIECE_VALUES
+
+# capturing the king wins, so it outranks any other capture
+_VICTIM_VALUES = dict(PIECE_VALUES, King=1000000)
+
+# attackers from least to most valuable, the king goes last since it should not be risked in an exchange
+_ATTACKER_RANKS = {}
+for _rank, _piece_name in enumerate(sorted(PIECE_VALUES, key=lambda name: (name == 'King', PIECE_VALUES[name]))):
+    _ATTACKER_RANKS[_piece_name] = _rank
+
+RESET_POLICIES = ('clear', 'age', 'keep')
+
+
+class MoveOrderer:
+    """orders packed moves for a search. Memory is killer_slots killer moves for each of max_ply plies and, if
+    history is on, two tables (one per color) of 1 << 14 counters indexed by packed move. reset_policy says what
+    new_search does: 'clear' empties both tables, 'age' empties killers and halves history, 'keep' leaves both"""
+
+    def __init__(self, killer_slots=2, max_ply=64, history=True, history_limit=1 << 20, reset_policy='age'):
+        if reset_policy not in RESET_POLICIES:
+            raise ValueError('reset_policy must be one of ' + ', '.join(RESET_POLICIES))
+        self._killer_slots = killer_slots
+        self._max_ply = max_ply
+        self._history_on = history
+        self._history_limit = history_limit
+        self._reset_policy = reset_policy
+        self._killers = None
+        self._history = None
+        self.clear()
+
+    def clear(self):
+        """empties killer and history tables"""
+        self._killers = [[] for _ in range(self._max_ply)]
+        self._history = {'w': [0] * (1 << 14), 'b': [0] * (1 << 14)} if self._history_on else None
+
+    def new_search(self):
+        """applies reset policy before a new search"""
+        if self._reset_policy == 'clear':
+            self.clear()
+        elif self._reset_policy == 'age':
+            self._killers = [[] for _ in range(self._max_ply)]
+            self._age_history()
+
+    def get_killers(self, ply):
+        """returns killer moves recorded at ply, most recent first"""
+        if ply < self._max_ply:
+            return list(self._killers[ply])
+        return []
+
+    def get_history(self, color, move):
+        """returns history score of color's packed move, 0 if history is off"""
+        if self._history is None:
+            return 0
+        return self._history[color][move]
+
+    def order(self, game, moves, table_move=None, ply=0, captures_only=False):
+        """returns moves (legal packed moves of game) in search order. With captures_only, only captures are
+        returned, by MVV-LVA"""
+        captures = []
+        quiet = []
+        killers = self._killers[ply] if ply < self._max_ply and not captures_only else ()
+        found_killers = []
+        found_table_move = False
+        for move in moves:
+            if move == table_move:
+                found_table_move = True
+                continue
+            captured_piece = None if move >> 12 else game.get_piece_on((move >> 6) & 63)
+            if captured_piece is not None:
+                attacker = game.get_piece_on(move & 63)
+                value = _VICTIM_VALUES[captured_piece.get_name()] * 16 - _ATTACKER_RANKS[attacker.get_name()]
+                captures.append((value, move))
+            elif captures_only:
+                continue
+            elif move in killers:
+                found_killers.append(move)
+            else:
+                quiet.append(move)
+        captures.sort(key=lambda capture: capture[0], reverse=True)
+
+        ordered = [move for value, move in captures]
+        if captures_only:
+            return ordered
+        if found_table_move:
+            ordered.insert(0, table_move)
+        ordered.extend(move for move in killers if move in found_killers)
+        if self._history is not None:
+            # stable sort keeps generation order among moves with the same score
+            history = self._history[game.get_turn()]
+            quiet.sort(key=history.__getitem__, reverse=True)
+        ordered.extend(quiet)
+        return ordered
+
+    def record_cutoff(self, game, move, depth, ply):
+        """records that move caused a beta cutoff at ply with depth left, call with the move taken back. Captures
+        are already ordered first so only quiet moves and fairy piece entries are recorded"""
+        if not move >> 12 and game.get_piece_on((move >> 6) & 63) is not None:
+            return
+        if ply < self._max_ply and self._killer_slots:
+            killers = self._killers[ply]
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[self._killer_slots:]
+        if self._history is not None:
+            history = self._history[game.get_turn()]
+            history[move] += depth * depth
+            if history[move] > self._history_limit:
+                self._age_history()
+
+    def _age_history(self):
+        """halves every history score so old cutoffs count less than new ones"""
+        if self._history is not None:
+            for color in ('w', 'b'):
+                self._history[color] = [score >> 1 for score in self._history[color]]
@@ -0,0 +1,70 @@
+# Description: runs perft and root move searches for a ChessVar position across worker processes. Each root move
+# is one task, workers rebuild the position from its to_bytes snapshot, and results are merged in root move
+# order so every run gives the same answer
+
+from concurrent.futures import ProcessPoolExecutor
+
+from chess_perft import perft
+from chess_search import Searcher, WIN_SCORE
+
+
+def parallel_perft(game, depth, workers=None, executor=None):
+    """returns (total leaf count, dict of root move to count) for perft to depth, one task per root move.
+    Pass an executor to reuse worker processes between calls"""
+    if depth <= 1:
+        return perft(game, depth), {}
+    results = _run_root_moves(game, _perft_worker, (depth - 1,), workers, executor)
+    return sum(results.values()), results
+
+
+def parallel_search(game, depth, workers=None, executor=None, table_size=1 << 18):
+    """searches every root move to depth in its own task, returns (best move, score, dict of root move to score).
+    Best move is the highest score, ties go to the move generate_moves lists first. Best move is None if there
+    are no legal moves"""
+    results = _run_root_moves(game, _search_worker, (depth - 1, table_size), workers, executor)
+    best_move = None
+    best_score = -WIN_SCORE - 1
+    for move, score in results.items():
+        if score > best_score:
+            best_move = move
+            best_score = score
+    return best_move, best_score, results
+
+
+def _run_root_moves(game, worker, worker_args, workers, executor):
+    """submits worker for each root move of game, returns dict of root move to result in generate_moves order"""
+    game_class = type(game)
+    position = game.to_bytes()
+    root_moves = list(game.generate_moves())
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(worker, game_class, position, move, *worker_args) for move in root_moves]
+        return {move: future.result() for move, future in zip(root_moves, futures)}
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def _rebuild(game_class, position, move):
+    """returns new game of game_class loaded from position bytes, with move played"""
+    game = game_class.from_bytes(position)
+    game.push_move(move)
+    return game
+
+
+def _perft_worker(game_class, position, move, depth):
+    """perft count below one root move"""
+    return perft(_rebuild(game_class, position, move), depth)
+
+
+def _search_worker(game_class, position, move, depth, table_size):
+    """score of one root move for player who made it, searched to fixed depth so results do not depend on timing"""
+    game = _rebuild(game_class, position, move)
+    if game.get_game_state() != 'UNFINISHED':
+        return WIN_SCORE - 1
+    if depth <= 0:
+        return -Searcher(table_size).evaluate(game)
+    return -Searcher(table_size).search(game, max_depth=depth).score
@@ -0,0 +1,126 @@
+# Description: perft benchmark for ChessVar move generation. Counts leaf nodes to a given depth from fixed
+# positions, reports nodes per second, and checks counts against a recorded baseline.
+# Run: python chess_perft.py [--depth N] [--position NAME] [--backend list|bitboard]
+
+import argparse
+import time
+
+from ChessVar import ChessVar, BitboardChessVar, decode_move, square_name
+
+BACKENDS = {
+    'list': ChessVar,
+    'bitboard': BitboardChessVar,
+}
+
+# positions are reached by playing moves from the start, ('Falcon', 'e3') style moves enter a fairy piece
+POSITIONS = {
+    'start': [],
+
+    # both players have lost a knight, black to move can enter either fairy piece on any empty square
+    'drops': [('b1', 'c3'), ('g8', 'f6'), ('c3', 'd5'), ('f6', 'd5'), ('e2', 'e4'), ('a7', 'a6'), ('e4', 'd5')],
+
+    # a Hunter and a Falcon on the board, each player has one fairy piece left in reserve
+    'fairy': [('b1', 'c3'), ('g8', 'f6'), ('c3', 'd5'), ('f6', 'd5'), ('e2', 'e4'), ('a7', 'a6'), ('e4', 'd5'),
+              ('Hunter', 'e5'), ('Falcon', 'e3'), ('c7', 'c6')],
+}
+
+# expected leaf counts, index is depth. Any change to move generation that changes these is a rules change
+BASELINE = {
+    'start': [1, 19, 380, 8524, 191315, 4926938],
+    'drops': [1, 85, 7994, 274154, 13695806],
+    'fairy': [1, 37, 865, 30869, 764219],
+}
+
+
+def setup_position(name, backend='list'):
+    """returns new game of given backend with named position's moves played"""
+    game = BACKENDS[backend]()
+    for first, second in POSITIONS[name]:
+        if first in ('Falcon', 'Hunter'):
+            played = game.enter_fairy_piece(first, second)
+        else:
+            played = game.make_move(first, second)
+        if not played:
+            raise ValueError('move ' + first + ' ' + second + ' is not legal in position ' + name)
+    return game
+
+
+def perft(game, depth):
+    """returns number of move sequences of length depth from game's position, game is left unchanged"""
+    moves = game.generate_moves()
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+
+    nodes = 0
+    for move in moves:
+        game.push_move(move)
+        nodes += perft(game, depth - 1)
+        game.pop_move()
+    return nodes
+
+
+def divide(game, depth):
+    """returns dict of each root move (as text) to perft count below it, for tracking down count differences"""
+    counts = {}
+    for move in game.generate_moves():
+        game.push_move(move)
+        counts[move_text(move)] = perft(game, depth - 1)
+        game.pop_move()
+    return counts
+
+
+def move_text(move):
+    """returns packed move as text, 'e2e4' for moves and 'Falcon@e3' for fairy piece entries"""
+    from_square, to_square, fairy_piece = decode_move(move)
+    if fairy_piece is not None:
+        return fairy_piece + '@' + square_name(to_square)
+    return square_name(from_square) + square_name(to_square)
+
+
+def run(position, depth, backend='list'):
+    """times perft to each depth up to depth, returns list of (depth, nodes, seconds, matches baseline or None)"""
+    game = setup_position(position, backend)
+    results = []
+    for current_depth in range(1, depth + 1):
+        start = time.perf_counter()
+        nodes = perft(game, current_depth)
+        seconds = time.perf_counter() - start
+        expected = BASELINE[position][current_depth] if current_depth < len(BASELINE[position]) else None
+        results.append((current_depth, nodes, seconds, None if expected is None else nodes == expected))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar perft benchmark')
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--position', choices=sorted(POSITIONS) + ['all'], default='all')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='list')
+    parser.add_argument('--divide', action='store_true', help='print counts per root move at --depth')
+    args = parser.parse_args()
+
+    positions = sorted(POSITIONS) if args.position == 'all' else [args.position]
+    failed = False
+    for position in positions:
+        if args.divide:
+            for move, nodes in sorted(divide(setup_position(position, args.backend), args.depth).items()):
+                print(position, move, nodes)
+            continue
+
+        for depth, nodes, seconds, matches in run(position, args.depth, args.backend):
+            if matches is None:
+                status = 'no baseline'
+            elif matches:
+                status = 'ok'
+            else:
+                status = 'MISMATCH expected ' + str(BASELINE[position][depth])
+                failed = True
+            rate = nodes / seconds if seconds > 0 else 0.0
+            print('%-6s %-8s depth %d %12d nodes %8.3fs %12.0f nodes/sec  %s'
+                  % (position, args.backend, depth, nodes, seconds, rate, status))
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
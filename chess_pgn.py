@@ -0,0 +1,168 @@
+# Description: PGN style text format for ChessVar games. Tag pairs, then numbered moves in coordinate notation
+# ('e2e4') with fairy piece entries written as piece letter @ square ('F@e3' Falcon, 'H@e3' Hunter), then the result
+# ('1-0', '0-1' or '*' for unfinished games). Reading and writing go one game at a time, so files of any size are
+# handled in constant memory, and read moves come back packed for ChessVar.replay.
+# Export: python chess_pgn.py export ARCHIVE PGN     Import: python chess_pgn.py import PGN ARCHIVE
+#
+#   [Event "self-play"]
+#   [Result "1-0"]
+#
+#   1. e2e4 d7d5 2. e4d5 F@e6 ... 1-0
+
+import argparse
+import re
+from array import array
+
+from ChessVar import ChessVar, decode_move, encode_move, square_index, square_name
+from chess_archive import read_games as read_archive, write_game as write_archive_game
+
+RESULT_TOKENS = {'UNFINISHED': '*', 'WHITE_WON': '1-0', 'BLACK_WON': '0-1'}
+_TOKEN_RESULTS = {token: result for result, token in RESULT_TOKENS.items()}
+
+FAIRY_LETTERS = {'Falcon': 'F', 'Hunter': 'H'}
+_DROP_PIECES = {'F': 'Falcon', 'H': 'Hunter', 'Falcon': 'Falcon', 'Hunter': 'Hunter'}
+
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_MOVE_NUMBER = re.compile(r'\d+\.+')
+_LINE_LENGTH = 80
+
+
+def move_notation(move):
+    """returns packed move in file notation, 'e2e4' for moves and 'F@e3' for fairy piece entries"""
+    from_square, to_square, fairy_piece = decode_move(move)
+    if fairy_piece is not None:
+        return FAIRY_LETTERS[fairy_piece] + '@' + square_name(to_square)
+    return square_name(from_square) + square_name(to_square)
+
+
+def parse_move(token):
+    """returns packed move for 'e2e4', 'F@e3' or 'Falcon@e3', raises ValueError if token is not a move"""
+    try:
+        if '@' in token:
+            piece, square_to = token.split('@')
+            return encode_move(None, square_index(square_to), _DROP_PIECES[piece])
+        return encode_move(square_index(token[:2]), square_index(token[2:]))
+    except (KeyError, ValueError):
+        raise ValueError('not a move: ' + token)
+
+
+def write_game(file, moves, result='UNFINISHED', tags=None):
+    """writes one game to text file object: tags (dict, written in order after Result is filled in), packed moves
+    and result ('UNFINISHED', 'WHITE_WON', 'BLACK_WON')"""
+    tags = dict(tags or {})
+    tags['Result'] = RESULT_TOKENS[result]
+    for name, value in tags.items():
+        file.write('[%s "%s"]\n' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"')))
+    file.write('\n')
+
+    line = []
+    length = 0
+    for ply, move in enumerate(moves):
+        # white's moves keep their move number on the same line
+        token = move_notation(move)
+        if ply % 2 == 0:
+            token = '%d. %s' % (ply // 2 + 1, token)
+        if length + len(token) + 1 > _LINE_LENGTH and line:
+            file.write(' '.join(line) + '\n')
+            line = []
+            length = 0
+        line.append(token)
+        length += len(token) + 1
+    line.append(RESULT_TOKENS[result])
+    file.write(' '.join(line) + '\n\n')
+
+
+def read_games(file):
+    """yields (tags dict, array of packed moves, result) for each game in text file object or path, one at a time.
+    Move numbers ('1.', '1...', or run into the move as in '1.e2e4'), {comments} and ; comments are skipped.
+    Raises ValueError naming the line of a bad token"""
+    if isinstance(file, str):
+        with open(file) as pgn:
+            yield from read_games(pgn)
+        return
+
+    tags = {}
+    moves = array('H')
+    in_movetext = False
+    in_comment = False
+    for line_number, line in enumerate(file, 1):
+        stripped = line.strip()
+        if not in_comment and stripped.startswith('['):
+            if in_movetext:
+                # previous game had no result token
+                yield tags, moves, _TOKEN_RESULTS.get(tags.get('Result'), 'UNFINISHED')
+                tags, moves, in_movetext = {}, array('H'), False
+            match = _TAG.match(stripped)
+            if match is None:
+                raise ValueError('line %d: bad tag' % line_number)
+            tags[match.group(1)] = re.sub(r'\\(.)', r'\1', match.group(2))
+            continue
+        if not in_comment and stripped.startswith('%'):
+            continue
+
+        for token in re.findall(r'[{}]|[^\s{}]+', line):
+            if in_comment:
+                in_comment = token != '}'
+                continue
+            if token == '{':
+                in_comment = True
+                continue
+            if token.startswith(';'):
+                break
+            in_movetext = True
+            if token in _TOKEN_RESULTS:
+                yield tags, moves, _TOKEN_RESULTS[token]
+                tags, moves, in_movetext = {}, array('H'), False
+                continue
+            # move numbers stand alone ('1.', '3...') or run into the move ('1.e2e4')
+            number = _MOVE_NUMBER.match(token)
+            if number:
+                token = token[number.end():]
+                if not token:
+                    continue
+            try:
+                moves.append(parse_move(token))
+            except ValueError as error:
+                raise ValueError('line %d: %s' % (line_number, error))
+
+    if in_movetext or tags:
+        yield tags, moves, _TOKEN_RESULTS.get(tags.get('Result'), 'UNFINISHED')
+
+
+def replay_games(file, game_class=ChessVar, trusted=False):
+    """yields (tags, game, legal) for each game in file, game is a new game_class with the moves replayed through
+    ChessVar.replay. Replay stops at the first illegal move and legal is False. With trusted=True moves are not
+    checked, see ChessVar.replay"""
+    for tags, moves, result in read_games(file):
+        game = game_class()
+        legal = all(game.replay(moves, trusted))
+        yield tags, game, legal
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar PGN style import and export')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help='write chess_archive games as text')
+    export.add_argument('archive')
+    export.add_argument('pgn')
+    import_ = commands.add_parser('import', help='append text games to a chess_archive file')
+    import_.add_argument('pgn')
+    import_.add_argument('archive')
+    args = parser.parse_args()
+
+    count = 0
+    if args.command == 'export':
+        with open(args.pgn, 'w') as pgn:
+            for result, moves in read_archive(args.archive):
+                count += 1
+                write_game(pgn, moves, result, {'Game': count})
+    else:
+        with open(args.archive, 'ab') as archive:
+            for tags, moves, result in read_games(args.pgn):
+                count += 1
+                write_archive_game(archive, moves, result)
+    print(count, 'games')
+
+
+if __name__ == '__main__':
+    main()
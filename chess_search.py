@@ -0,0 +1,288 @@
+# Description: iterative deepening alpha-beta search for ChessVar games. Positions are cached in a fixed size
+# transposition table, searches stop on a time or node budget
+
+import time
+from collections import namedtuple
+
+from chess_eval import Evaluator
+from chess_ordering import MoveOrderer
+from chess_tablebase import game_piece_set
+
+# win condition is capturing the king, so a lost position scores below any material difference
+WIN_SCORE = 1000000
+
+# transposition table entry bounds
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+SearchResult = namedtuple('SearchResult', ['move', 'score', 'depth', 'nodes', 'seconds'])
+
+
+class _SearchStopped(Exception):
+    """raised inside the search when the time or node budget runs out"""
+
+
+class TranspositionTable:
+    """fixed size hash table of search results keyed on ChessVar.get_hash(). One entry per slot, an entry is
+    replaced by a search of equal or greater depth, or by any search once it is left over from an earlier search"""
+
+    def __init__(self, size=1 << 20):
+        # round size down to a power of two so slot is hash & mask
+        self._size = 1 << (size.bit_length() - 1)
+        self._mask = self._size - 1
+        self._keys = [0] * self._size
+        self._entries = [None] * self._size
+        self._generation = 0
+
+    def get_size(self):
+        """returns number of slots in table"""
+        return self._size
+
+    def new_search(self):
+        """marks entries from earlier searches as replaceable"""
+        self._generation += 1
+
+    def clear(self):
+        """empties every slot"""
+        self._keys = [0] * self._size
+        self._entries = [None] * self._size
+
+    def probe(self, key):
+        """returns (depth, score, bound, move) stored for key, or None"""
+        slot = key & self._mask
+        if self._keys[slot] == key and self._entries[slot] is not None:
+            return self._entries[slot][:4]
+        return None
+
+    def store(self, key, depth, score, bound, move):
+        """saves search result for key unless slot holds a deeper result from this search, for key or another one"""
+        slot = key & self._mask
+        entry = self._entries[slot]
+        if entry is not None and entry[4] == self._generation and entry[0] > depth:
+            return
+        self._keys[slot] = key
+        self._entries[slot] = (depth, score, bound, move, self._generation)
+
+
+class Searcher:
+    """plays ChessVar positions: iterative deepening negamax with alpha-beta pruning and a transposition table.
+    Works with ChessVar and BitboardChessVar, the game is left in the position it was given, with its own running
+    score (ChessVar.enable_evaluation) if it kept one. Positions covered by one of tablebases
+    (chess_tablebase.Tablebase objects) are scored from the table instead of searched"""
+
+    def __init__(self, table_size=1 << 20, evaluator=None, orderer=None, tablebases=()):
+        self._table = TranspositionTable(table_size)
+        self._evaluator = Evaluator() if evaluator is None else evaluator
+        self._orderer = MoveOrderer() if orderer is None else orderer
+        self._tablebases = {tablebase.get_name(): tablebase for tablebase in tablebases}
+        self._tablebase_pieces = max((len(name) - 1 for name in self._tablebases), default=0)
+        self._nodes = 0
+        self._node_limit = None
+        self._deadline = None
+        self._next_check = 0
+
+    def get_table(self):
+        """returns transposition table used by searcher"""
+        return self._table
+
+    def search(self, game, max_depth=64, time_limit=None, node_limit=None):
+        """searches game's position until max_depth is done or time_limit (seconds) or node_limit runs out,
+        returns SearchResult for the deepest finished iteration (move is None if there are no legal moves, or if the
+        budget runs out before depth 1 is done). game is left as it was given, evaluation state included"""
+        # game keeps a running score with the evaluator's tables during the search, and gets its own evaluation
+        # state back after
+        tables = game.get_evaluation_tables()
+        self._evaluator.attach(game)
+        try:
+            return self._deepen(game, max_depth, time_limit, node_limit)
+        finally:
+            attached = game.get_evaluation_tables()
+            if tables is None:
+                game.disable_evaluation()
+            elif tables[0] is not attached[0] or tables[1] is not attached[1]:
+                game.enable_evaluation(*tables)
+
+    def _deepen(self, game, max_depth, time_limit, node_limit):
+        """iterative deepening for search, returns SearchResult"""
+        start = time.perf_counter()
+        self._nodes = 0
+        self._node_limit = node_limit
+        self._deadline = None if time_limit is None else start + time_limit
+        # budget is checked on the first node, then as set by _check_budget
+        self._next_check = 1
+        self._table.new_search()
+        self._orderer.new_search()
+
+        result = SearchResult(None, self.evaluate(game), 0, 0, 0.0)
+        root_moves = list(game.generate_moves())
+        if not root_moves:
+            return result
+
+        for depth in range(1, max_depth + 1):
+            try:
+                score, move = self._search_root(game, root_moves, depth)
+            except _SearchStopped:
+                break
+            result = SearchResult(move, score, depth, self._nodes, time.perf_counter() - start)
+
+            # best move first on the next iteration, stop early once a forced win or loss is found
+            root_moves.remove(move)
+            root_moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - max_depth:
+                break
+
+        return result._replace(nodes=self._nodes, seconds=time.perf_counter() - start)
+
+    def evaluate(self, game):
+        """returns static score of position for player whose turn it is, see chess_eval.Evaluator.evaluate"""
+        return self._evaluator.evaluate(game)
+
+    def _search_root(self, game, moves, depth):
+        """searches every root move to depth, returns (score, best move)"""
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.push_move(move)
+            try:
+                score = -self._negamax(game, depth - 1, -WIN_SCORE - 1, -alpha, 1)
+            finally:
+                game.pop_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        self._table.store(game.get_hash(), depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        """returns score of position for player to move, searched to depth"""
+        self._nodes += 1
+        if self._nodes >= self._next_check:
+            self._check_budget()
+
+        # previous move captured the king, player to move has lost
+        if game.get_game_state() != 'UNFINISHED':
+            return -WIN_SCORE + ply
+
+        if self._tablebases:
+            score = self._probe_tablebases(game, ply)
+            if score is not None:
+                return score
+
+        if depth <= 0:
+            return self._quiesce(game, alpha, beta, ply)
+
+        key = game.get_hash()
+        entry = self._table.probe(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_score, bound, table_move = entry
+            if entry_depth >= depth:
+                entry_score = _score_from_table(entry_score, ply)
+                if bound == EXACT:
+                    return entry_score
+                if bound == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if bound == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        moves = self._orderer.order(game, game.generate_moves(), table_move, ply)
+        if not moves:
+            return 0
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.push_move(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.pop_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self._orderer.record_cutoff(game, move, depth, ply)
+                        break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self._table.store(key, depth, _score_to_table(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiesce(self, game, alpha, beta, ply):
+        """searches captures only so leaf scores are not taken in the middle of an exchange"""
+        stand_pat = self.evaluate(game)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        for move in self._orderer.order(game, game.generate_moves(), captures_only=True):
+            self._nodes += 1
+            if self._nodes >= self._next_check:
+                self._check_budget()
+            game.push_move(move)
+            try:
+                if game.get_game_state() != 'UNFINISHED':
+                    score = WIN_SCORE - ply - 1
+                else:
+                    score = -self._quiesce(game, -beta, -alpha, ply + 1)
+            finally:
+                game.pop_move()
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _probe_tablebases(self, game, ply):
+        """returns score of position from a tablebase, or None if no tablebase covers it"""
+        if len(game.get_piece_squares('w')) + len(game.get_piece_squares('b')) > self._tablebase_pieces:
+            return None
+        tablebase = self._tablebases.get(game_piece_set(game))
+        result = None if tablebase is None else tablebase.probe(game)
+        if result is None:
+            return None
+        outcome, plies = result
+        if outcome == 'WIN':
+            return WIN_SCORE - ply - plies
+        if outcome == 'LOSS':
+            return -WIN_SCORE + ply + plies
+        return 0
+
+    def _check_budget(self):
+        """raises _SearchStopped if node or time budget is used up, else sets the node count of the next check: the
+        node limit, or 1024 nodes on so the clock is not read on every node"""
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise _SearchStopped
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise _SearchStopped
+        self._next_check = self._nodes + 1024
+        if self._node_limit is not None:
+            self._next_check = min(self._next_check, self._node_limit)
+
+
+def _score_to_table(score, ply):
+    """win scores are stored relative to the position so they stay right when reached at another ply"""
+    if score >= WIN_SCORE - 1000:
+        return score + ply
+    if score <= -WIN_SCORE + 1000:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """undoes _score_to_table for position found at ply"""
+    if score >= WIN_SCORE - 1000:
+        return score - ply
+    if score <= -WIN_SCORE + 1000:
+        return score + ply
+    return score
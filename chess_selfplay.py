@@ -0,0 +1,150 @@
+# Description: generates ChessVar self-play games in worker processes for training data. Each worker plays its share
+# of the games with a move policy and sends finished games through a bounded queue, the parent writes them to a
+# chess_archive file as they arrive, so memory stays flat however many games are played.
+# Run: python chess_selfplay.py ARCHIVE [--games N] [--workers N] [--policy random|search] [--depth N]
+
+import argparse
+import multiprocessing
+import os
+import queue
+import random
+import time
+import traceback
+from array import array
+
+from ChessVar import ChessVar
+from chess_archive import write_game
+from chess_search import Searcher
+
+
+def random_policy(game, rng):
+    """returns a legal move picked uniformly at random"""
+    return rng.choice(game.generate_moves())
+
+
+class SearchPolicy:
+    """plays the best move of a fixed depth search, or a random move with probability randomness so games do not
+    all repeat. The searcher is created in the worker on first use so only the settings are sent to it"""
+
+    def __init__(self, depth=2, randomness=0.1, table_size=1 << 16):
+        self._depth = depth
+        self._randomness = randomness
+        self._table_size = table_size
+        self._searcher = None
+
+    def __getstate__(self):
+        return self._depth, self._randomness, self._table_size
+
+    def __setstate__(self, state):
+        self._depth, self._randomness, self._table_size = state
+        self._searcher = None
+
+    def __call__(self, game, rng):
+        if rng.random() < self._randomness:
+            return random_policy(game, rng)
+        if self._searcher is None:
+            self._searcher = Searcher(self._table_size)
+        return self._searcher.search(game, max_depth=self._depth).move
+
+
+def play_game(policy=random_policy, rng=None, max_plies=200, game_class=ChessVar):
+    """plays one game from the starting position, policy(game, rng) picks each packed move. Game ends when a king
+    is captured, the player to move has no moves or max_plies moves are made. Returns (result, array of moves)"""
+    rng = random.Random() if rng is None else rng
+    game = game_class()
+    for _ in range(max_plies):
+        if game.get_game_state() != 'UNFINISHED' or not game.generate_moves():
+            break
+        if not game.push_move(policy(game, rng)):
+            raise ValueError('policy returned an illegal move')
+    return game.get_game_state(), game.get_moves_played()
+
+
+def generate_games(file, games, policy=random_policy, workers=None, seed=0, max_plies=200, queue_size=64,
+                   game_class=ChessVar):
+    """plays games self-play games across worker processes (default one per core) and appends each to file (binary
+    file object or path) in chess_archive format as it finishes. Game i is played with random.Random(seed << 32 | i)
+    so each game is reproducible, archive order depends on which worker finishes first. At most queue_size finished
+    games wait to be written before workers block. Returns dict of result to number of games"""
+    if isinstance(file, str):
+        with open(file, 'ab') as archive:
+            return generate_games(archive, games, policy, workers, seed, max_plies, queue_size, game_class)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, games))
+    results = {'UNFINISHED': 0, 'WHITE_WON': 0, 'BLACK_WON': 0}
+    if games <= 0:
+        return results
+
+    finished_games = multiprocessing.Queue(maxsize=queue_size)
+    processes = [multiprocessing.Process(target=_selfplay_worker, daemon=True,
+                                         args=(finished_games, range(index, games, workers), policy, seed, max_plies,
+                                               game_class))
+                 for index in range(workers)]
+    for process in processes:
+        process.start()
+
+    try:
+        running = workers
+        while running:
+            try:
+                item = finished_games.get(timeout=1.0)
+            except queue.Empty:
+                # a worker killed from outside never sends its end marker
+                for process in processes:
+                    if process.exitcode not in (None, 0):
+                        raise RuntimeError('self-play worker exited with code %d' % process.exitcode)
+                continue
+            if item is None:
+                running -= 1
+            elif isinstance(item, str):
+                raise RuntimeError('self-play worker failed:\n' + item)
+            else:
+                result, data = item
+                moves = array('H')
+                moves.frombytes(data)
+                write_game(file, moves, result)
+                results[result] += 1
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+    return results
+
+
+def _selfplay_worker(finished_games, indexes, policy, seed, max_plies, game_class):
+    """plays game indexes, puts (result, move bytes) for each game then None when done, or traceback text on error"""
+    try:
+        for index in indexes:
+            result, moves = play_game(policy, random.Random(seed << 32 | index), max_plies, game_class)
+            finished_games.put((result, moves.tobytes()))
+    except Exception:
+        finished_games.put(traceback.format_exc())
+        return
+    finished_games.put(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar self-play game generator')
+    parser.add_argument('archive')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--policy', choices=['random', 'search'], default='random')
+    parser.add_argument('--depth', type=int, default=2, help='search depth for --policy search')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-plies', type=int, default=200)
+    parser.add_argument('--queue-size', type=int, default=64)
+    args = parser.parse_args()
+
+    policy = SearchPolicy(args.depth) if args.policy == 'search' else random_policy
+    start = time.perf_counter()
+    results = generate_games(args.archive, args.games, policy, args.workers, args.seed, args.max_plies,
+                             args.queue_size)
+    seconds = time.perf_counter() - start
+    print('%d games in %.1fs (%.1f games/sec)' % (args.games, seconds, args.games / seconds if seconds > 0 else 0.0))
+    for result, count in results.items():
+        print(result, count)
+
+
+if __name__ == '__main__':
+    main()
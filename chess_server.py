@@ -0,0 +1,287 @@
+# Description: asyncio server hosting many ChessVar games. Clients send one JSON request per line over TCP or a
+# Unix socket and get one JSON response per line, in order. Requests that arrive together are answered with one
+# write. Run: python chess_server.py [--host HOST] [--port PORT] [--unix PATH]
+#
+# requests: {"op": "new"}                                      -> {"ok": true, "game": id}
+#           {"op": "move", "game": id, "from": "e2", "to": "e4"} -> {"ok": bool, "turn": ..., "state": ...}
+#           {"op": "drop", "game": id, "piece": "Falcon", "to": "e3"}
+#           {"op": "check", "game": id, "from": "e2", "to": "e4"} -> {"ok": true, "legal": bool}
+#           {"op": "state", "game": id}   {"op": "close", "game": id}   {"op": "stats"}
+# an "id" field in a request is copied to its response
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from ChessVar import ChessVar, MoveCache
+
+# requests that name a game
+_GAME_OPS = ('move', 'drop', 'check', 'state', 'close')
+
+
+class SessionManager:
+    """holds the server's ChessVar games and answers requests for them, keeps move latencies for stats. With
+    move_cache_size, games share a MoveCache of that many positions for move and check requests"""
+
+    def __init__(self, max_games=None, game_class=ChessVar, latency_samples=100000, move_cache_size=None):
+        self._games = {}
+        self._next_id = 1
+        self._max_games = max_games
+        self._game_class = game_class
+        self._latencies = deque(maxlen=latency_samples)
+        self._moves = 0
+        self._move_cache = MoveCache(move_cache_size) if move_cache_size else None
+
+    def get_game_count(self):
+        """returns number of open games"""
+        return len(self._games)
+
+    def get_game(self, game_id):
+        """returns ChessVar for game id, or None"""
+        return self._games.get(game_id)
+
+    def handle(self, request):
+        """returns response dict for request dict"""
+        op = request.get('op')
+        game_id = request.get('game')
+        if op in _GAME_OPS and (not isinstance(game_id, int) or isinstance(game_id, bool)):
+            # game ids are ints, anything else (lists, dicts) cannot even be looked up
+            response = {'ok': False, 'error': 'bad request'}
+        elif op == 'move' or op == 'drop':
+            start = time.perf_counter()
+            response = self._play(request)
+            self._latencies.append(time.perf_counter() - start)
+            self._moves += 1
+        elif op == 'new':
+            response = self._new_game()
+        elif op == 'check':
+            response = self._check(request)
+        elif op == 'state':
+            response = self._state(request)
+        elif op == 'close':
+            response = {'ok': self._games.pop(game_id, None) is not None}
+        elif op == 'stats':
+            response = self.get_stats()
+            response['ok'] = True
+        else:
+            response = {'ok': False, 'error': 'unknown op'}
+
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def get_stats(self):
+        """returns dict of open games, moves handled, p50/p99 move latency in milliseconds over recent moves, and move
+        cache statistics if there is a cache"""
+        latencies = sorted(self._latencies)
+        stats = {'games': len(self._games), 'moves': self._moves, 'p50_ms': None, 'p99_ms': None}
+        if latencies:
+            stats['p50_ms'] = latencies[(len(latencies) - 1) * 50 // 100] * 1000
+            stats['p99_ms'] = latencies[(len(latencies) - 1) * 99 // 100] * 1000
+        if self._move_cache is not None:
+            stats['move_cache'] = self._move_cache.get_stats()
+        return stats
+
+    def _new_game(self):
+        """opens a game, returns its id"""
+        if self._max_games is not None and len(self._games) >= self._max_games:
+            return {'ok': False, 'error': 'too many games'}
+        game_id = self._next_id
+        self._next_id += 1
+        self._games[game_id] = self._game_class()
+        if self._move_cache is not None:
+            self._games[game_id].set_move_cache(self._move_cache)
+        return {'ok': True, 'game': game_id}
+
+    def _play(self, request):
+        """makes move or enters fairy piece for request, returns result with game's turn and state"""
+        game = self._games.get(request.get('game'))
+        if game is None:
+            return {'ok': False, 'error': 'no such game'}
+        try:
+            if request['op'] == 'move':
+                played = game.make_move(request['from'], request['to'])
+            else:
+                played = game.enter_fairy_piece(request['piece'], request['to'])
+        except (KeyError, TypeError, ValueError, IndexError):
+            return {'ok': False, 'error': 'bad request'}
+        return {'ok': played, 'turn': game.get_turn(), 'state': game.get_game_state()}
+
+    def _check(self, request):
+        """returns whether request's move is legal in its game, without making it"""
+        game = self._games.get(request.get('game'))
+        if game is None:
+            return {'ok': False, 'error': 'no such game'}
+        try:
+            square_from, square_to = request['from'], request['to']
+            from_col, from_row = ord(square_from[0]) - 97, int(square_from[1:]) - 1
+            to_col, to_row = ord(square_to[0]) - 97, int(square_to[1:]) - 1
+        except (KeyError, TypeError, ValueError, IndexError):
+            return {'ok': False, 'error': 'bad request'}
+        return {'ok': True, 'legal': game.valid_move(from_col, from_row, to_col, to_row)}
+
+    def _state(self, request):
+        """returns turn, game state and board of request's game, board is 8 rows of piece names (None if empty)"""
+        game = self._games.get(request.get('game'))
+        if game is None:
+            return {'ok': False, 'error': 'no such game'}
+        board = [[None if chess_piece is None else chess_piece.get_color() + chess_piece.get_name()
+                  for chess_piece in row] for row in game.get_board()]
+        return {'ok': True, 'turn': game.get_turn(), 'state': game.get_game_state(), 'board': board}
+
+
+class GameServer:
+    """serves a SessionManager over asyncio streams. A connection sending a request line longer than max_line bytes
+    gets an error response and is closed"""
+
+    def __init__(self, manager=None, read_size=65536, max_line=65536):
+        self._manager = manager if manager is not None else SessionManager()
+        self._read_size = read_size
+        self._max_line = max_line
+        self._servers = []
+
+    def get_manager(self):
+        """returns session manager"""
+        return self._manager
+
+    async def start_tcp(self, host='127.0.0.1', port=0):
+        """starts listening on TCP, returns (host, port) actually bound"""
+        server = await asyncio.start_server(self._serve, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path):
+        """starts listening on Unix socket path"""
+        server = await asyncio.start_unix_server(self._serve, path)
+        self._servers.append(server)
+
+    async def serve_forever(self):
+        """runs until cancelled"""
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self):
+        """stops listening"""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    async def _serve(self, reader, writer):
+        """answers every complete line in each chunk read, then writes the chunk's responses at once"""
+        pending = b''
+        try:
+            while True:
+                data = await reader.read(self._read_size)
+                if not data:
+                    break
+                lines = (pending + data).split(b'\n')
+                pending = lines.pop()
+
+                responses = []
+                too_long = len(pending) > self._max_line
+                for line in lines:
+                    if len(line) > self._max_line:
+                        too_long = True
+                        break
+                    if line.strip():
+                        responses.append(self._answer(line))
+                if too_long:
+                    # a client that never ends its line would otherwise grow pending without limit
+                    responses.append(_encode({'ok': False, 'error': 'line too long'}))
+                if responses:
+                    writer.write(b''.join(responses))
+                    await writer.drain()
+                if too_long:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _answer(self, line):
+        """returns encoded response line for one request line. A request the manager fails on gets an error response
+        so the other requests on the connection are still answered"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict):
+            return _encode({'ok': False, 'error': 'bad request'})
+        try:
+            return _encode(self._manager.handle(request))
+        except Exception:
+            response = {'ok': False, 'error': 'bad request'}
+            if 'id' in request:
+                response['id'] = request['id']
+            return _encode(response)
+
+
+def _encode(response):
+    """returns response dict as one JSON line"""
+    return json.dumps(response, separators=(',', ':')).encode() + b'\n'
+
+
+class GameClient:
+    """asyncio client for GameServer. request() waits for its answer, request_many() pipelines requests"""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect_tcp(cls, host, port):
+        """returns client connected to server on TCP"""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    @classmethod
+    async def connect_unix(cls, path):
+        """returns client connected to server on Unix socket path"""
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer)
+
+    async def request(self, **fields):
+        """sends one request, returns its response dict"""
+        return (await self.request_many([fields]))[0]
+
+    async def request_many(self, requests):
+        """sends list of request dicts in one write, returns list of responses in the same order"""
+        self._writer.write(b''.join(json.dumps(request).encode() + b'\n' for request in requests))
+        await self._writer.drain()
+        return [json.loads(await self._reader.readline()) for _ in requests]
+
+    async def close(self):
+        """closes connection"""
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _run(args):
+    """starts server from command line arguments and serves until interrupted"""
+    server = GameServer(SessionManager(max_games=args.max_games, move_cache_size=args.move_cache))
+    if args.unix:
+        await server.start_unix(args.unix)
+        print('listening on', args.unix)
+    else:
+        print('listening on %s:%d' % await server.start_tcp(args.host, args.port))
+    await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar game server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on this Unix socket path instead of TCP')
+    parser.add_argument('--max-games', type=int)
+    parser.add_argument('--move-cache', type=int, help='positions kept in shared legal move cache')
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
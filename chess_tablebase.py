@@ -0,0 +1,416 @@
+# Description: endgame tablebases for ChessVar positions with few pieces and no pawns, built by retrograde analysis
+# under the variant's rules: a game is won by capturing the king, there is no check, and a player with no moves is
+# stuck (scored as a draw). Piece sets are named by piece letters, white then black, e.g. 'KFvK' for king and Falcon
+# against king. Each set is one file of uint16 results, one per arrangement of the pieces and player to move, opened
+# with mmap so a probe is one read at a computed offset.
+# Build: python chess_tablebase.py build PIECE_SET DIRECTORY
+#
+# result values: 0 draw, odd n the player to move captures the king in n plies, even n the player to move has its
+# king captured in n plies, 0xFFFF for arrangements with two pieces on one square
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import product
+
+from ChessVar import get_piece_vectors
+
+_HEADER = struct.Struct('<6sH16s')
+TABLEBASE_MAGIC = b'CVTBLB'
+TABLEBASE_VERSION = 1
+
+DRAW = 0
+INVALID = 0xFFFF
+
+PIECE_LETTERS = {'King': 'K', 'Queen': 'Q', 'Rook': 'R', 'Bishop': 'B', 'Knight': 'N', 'Falcon': 'F', 'Hunter': 'H'}
+_LETTER_PIECES = {letter: piece_name for piece_name, letter in PIECE_LETTERS.items()}
+_LETTER_ORDER = 'KQRBNFH'
+_COLORS = ('w', 'b')
+
+
+def _vector_squares(square, row_offset, col_offset, repeat):
+    """returns squares reached from square by the (row, col) vector, nearest first: one step, or every step to the
+    board edge if repeat"""
+    row, col = square >> 3, square & 7
+    squares = []
+    while True:
+        row += row_offset
+        col += col_offset
+        if not (0 <= row <= 7 and 0 <= col <= 7):
+            return squares
+        squares.append(row * 8 + col)
+        if not repeat:
+            return squares
+
+
+# ChessVar's movement vectors (see ChessVar.PIECE_MOVEMENTS) as square tables: jump squares and the squares jumps
+# come from for each (piece name, color), and rays along every slide vector and its opposite, which walks a slide
+# backwards
+_SLIDE_VECTORS = {}
+_JUMPS = {}
+for _piece_name in PIECE_LETTERS:
+    for _color in _COLORS:
+        _slides, _jump_vectors = get_piece_vectors(_piece_name, _color)
+        _SLIDE_VECTORS[(_piece_name, _color)] = _slides
+        _JUMPS[(_piece_name, _color)] = [[to_square for vector in _jump_vectors
+                                          for to_square in _vector_squares(square, *vector, False)]
+                                         for square in range(64)]
+_JUMPS_FROM = {key: [[square for square in range(64) if to_square in table[square]] for to_square in range(64)]
+               for key, table in _JUMPS.items()}
+_RAYS = {}
+for _vectors in _SLIDE_VECTORS.values():
+    for _row_offset, _col_offset in _vectors:
+        for _vector in ((_row_offset, _col_offset), (-_row_offset, -_col_offset)):
+            _RAYS[_vector] = [_vector_squares(square, *_vector, True) for square in range(64)]
+
+
+def parse_piece_set(name):
+    """returns tuple of (color, piece name) for piece set name such as 'KFvK', in table order: white then black,
+    king first then by _LETTER_ORDER. Each side needs exactly one king"""
+    if name.count('v') != 1:
+        raise ValueError('piece set must look like KFvK')
+    pieces = []
+    for color, letters in zip(_COLORS, name.split('v')):
+        if letters.count('K') != 1 or any(letter not in _LETTER_PIECES for letter in letters):
+            raise ValueError('each side needs one K and letters from ' + _LETTER_ORDER)
+        for letter in sorted(letters, key=_LETTER_ORDER.index):
+            pieces.append((color, _LETTER_PIECES[letter]))
+    return tuple(pieces)
+
+
+def piece_set_name(pieces):
+    """returns name of piece set from (color, piece name) pairs in any order"""
+    sides = []
+    for color in _COLORS:
+        letters = [PIECE_LETTERS[piece_name] for piece_color, piece_name in pieces if piece_color == color]
+        sides.append(''.join(sorted(letters, key=_LETTER_ORDER.index)))
+    return 'v'.join(sides)
+
+
+def position_index(squares, turn):
+    """returns table index of pieces on squares (in table order) with turn ('w' or 'b') to move"""
+    index = 0
+    for square in squares:
+        index = index * 64 + square
+    return index * 2 + (turn == 'b')
+
+
+def generate(name, solved=None):
+    """returns dict of piece set name to array of results for name and every smaller set its captures lead to.
+    Pass solved (same kind of dict) to reuse sets already built, it is filled in as well"""
+    solved = {} if solved is None else solved
+    pieces = parse_piece_set(name)
+    name = piece_set_name(pieces)
+    if name in solved:
+        return solved
+
+    # capturing a piece other than a king leads to the set without it
+    for index, (color, piece_name) in enumerate(pieces):
+        if piece_name != 'King':
+            generate(piece_set_name(pieces[:index] + pieces[index + 1:]), solved)
+    solved[name] = _solve(pieces, solved)
+    return solved
+
+
+def build_tablebases(name, directory):
+    """generates piece set name and the sets it depends on, writes each to directory as NAME.cvtb unless the file
+    is already there. Returns list of paths written"""
+    written = []
+    solved = {}
+    for set_name in _dependencies(name):
+        path = os.path.join(directory, set_name + '.cvtb')
+        if os.path.exists(path):
+            with Tablebase(path) as table:
+                solved[set_name] = array('H', table.get_results())
+            continue
+        generate(set_name, solved)
+        write_tablebase(path, set_name, solved[set_name])
+        written.append(path)
+    return written
+
+
+def write_tablebase(path, name, results):
+    """writes results array for piece set name to path"""
+    results = array('H', results)
+    if sys.byteorder == 'big':
+        results.byteswap()
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, name.encode('ascii')))
+        file.write(results.tobytes())
+
+
+class Tablebase:
+    """read-only, memory mapped tablebase for one piece set. Use as a context manager or call close()"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap cannot map an empty file
+            self._file.close()
+            raise ValueError(path + ' is not a tablebase')
+        self._results = None
+        magic, version, name = _HEADER.unpack_from(self._map, 0) if len(self._map) >= _HEADER.size else (b'', 0, b'')
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+            self.close()
+            raise ValueError(path + ' is not a version %d tablebase' % TABLEBASE_VERSION)
+        self._name = name.rstrip(b'\0').decode('ascii')
+        self._pieces = parse_piece_set(self._name)
+        if len(self._map) != _HEADER.size + 2 * 2 * 64 ** len(self._pieces):
+            self.close()
+            raise ValueError(path + ' is truncated')
+        self._results = memoryview(self._map)[_HEADER.size:].cast('H')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """unmaps and closes file"""
+        if self._map is not None:
+            if self._results is not None:
+                self._results.release()
+                self._results = None
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+    def get_name(self):
+        """returns piece set name, such as 'KFvK'"""
+        return self._name
+
+    def get_results(self):
+        """returns the whole table as a memoryview of uint16 results"""
+        return self._results
+
+    def probe_index(self, index):
+        """returns raw result stored at table index (see position_index)"""
+        result = self._results[index]
+        if sys.byteorder == 'big':
+            result = ((result & 0xFF) << 8) | (result >> 8)
+        return result
+
+    def probe(self, game):
+        """returns ('WIN', plies), ('LOSS', plies) or ('DRAW', 0) for player to move in game's position, or None if
+        the position is not in this table: other pieces, game over, or a fairy piece could still be entered"""
+        if game.get_game_state() != 'UNFINISHED':
+            return None
+        squares = {}
+        for color in _COLORS:
+            for square in game.get_piece_squares(color):
+                piece_name = game.get_piece_on(square).get_name()
+                if piece_name not in PIECE_LETTERS:
+                    return None
+                squares.setdefault((color, piece_name), []).append(square)
+            if _can_enter_fairy_piece(game, color):
+                return None
+
+        ordered = []
+        for piece in self._pieces:
+            if not squares.get(piece):
+                return None
+            ordered.append(squares[piece].pop())
+        if any(squares.values()):
+            return None
+
+        result = self.probe_index(position_index(ordered, game.get_turn()))
+        if result == DRAW:
+            return 'DRAW', 0
+        if result & 1:
+            return 'WIN', result
+        return 'LOSS', result
+
+
+def game_piece_set(game):
+    """returns piece set name of game's position, or None if it has pawns"""
+    pieces = []
+    for color in _COLORS:
+        for square in game.get_piece_squares(color):
+            piece_name = game.get_piece_on(square).get_name()
+            if piece_name not in PIECE_LETTERS:
+                return None
+            pieces.append((color, piece_name))
+    return piece_set_name(pieces)
+
+
+def _can_enter_fairy_piece(game, color):
+    """True if color can enter a fairy piece now or later: both still in reserve (see ChessVar._fairy_piece_playable)
+    and a Queen, Knight or Bishop already lost or still on the board to be lost"""
+    if len(game.get_fairy_reserve(color)) < 2:
+        return False
+    for piece_name in ('Queen', 'Knight', 'Bishop'):
+        if game.get_lost_piece_count(color, piece_name):
+            return True
+    return any(game.get_piece_on(square).get_name() in ('Queen', 'Knight', 'Bishop')
+               for square in game.get_piece_squares(color))
+
+
+def _dependencies(name):
+    """returns piece set name and every smaller set its captures lead to, smallest first"""
+    found = []
+
+    def visit(pieces):
+        set_name = piece_set_name(pieces)
+        if set_name in found:
+            return
+        for index, (color, piece_name) in enumerate(pieces):
+            if piece_name != 'King':
+                visit(pieces[:index] + pieces[index + 1:])
+        found.append(set_name)
+
+    visit(parse_piece_set(name))
+    return found
+
+
+def _solve(pieces, solved):
+    """returns results array for pieces (table order), smaller sets must already be in solved"""
+    count = len(pieces)
+    size = 2 * 64 ** count
+    results = array('H', [INVALID]) * size
+    moves_left = array('H', [0]) * size
+
+    # children reached by a capture are in smaller sets with known results, their effect is applied when the
+    # search below reaches that many plies
+    capture_events = {}
+    frontier = {1: []}
+
+    for squares in product(range(64), repeat=count):
+        if len(set(squares)) < count:
+            continue
+        for turn_code, turn in enumerate(_COLORS):
+            index = position_index(squares, turn)
+            results[index] = DRAW
+            moves = 0
+            for piece, to_square, captured in _moves(pieces, squares, turn):
+                if captured is None:
+                    moves += 1
+                    continue
+                if pieces[captured][1] == 'King':
+                    results[index] = 1
+                    frontier[1].append(index)
+                    break
+                child_squares = squares[:captured] + squares[captured + 1:]
+                if captured < piece:
+                    piece -= 1
+                child_squares = child_squares[:piece] + (to_square,) + child_squares[piece + 1:]
+                child_pieces = pieces[:captured] + pieces[captured + 1:]
+                child_result = solved[piece_set_name(child_pieces)][
+                    position_index(child_squares, _COLORS[1 - turn_code])]
+                if child_result == DRAW:
+                    moves += 1
+                elif child_result & 1:
+                    # capture lets the other player win, counts as a move still to be refuted
+                    moves += 1
+                    capture_events.setdefault(child_result, []).append((index, False))
+                else:
+                    capture_events.setdefault(child_result, []).append((index, True))
+            moves_left[index] = moves
+
+    plies = 1
+    while frontier.get(plies) or any(level >= plies for level in capture_events):
+        next_level = frontier.setdefault(plies + 1, [])
+
+        # smaller set children reached at this many plies
+        for index, winning in capture_events.pop(plies, ()):
+            if results[index] != DRAW:
+                continue
+            if winning:
+                results[index] = plies + 1
+                next_level.append(index)
+            else:
+                moves_left[index] -= 1
+                if moves_left[index] == 0:
+                    results[index] = plies + 1
+                    next_level.append(index)
+
+        # positions decided in plies: each position one move earlier wins if this one is lost for the player to
+        # move, and loses once every one of its moves leads to a win for the other player
+        for index in frontier.pop(plies, ()):
+            for parent in _unmoves(pieces, index):
+                if results[parent] != DRAW:
+                    continue
+                if plies & 1 == 0:
+                    results[parent] = plies + 1
+                    next_level.append(parent)
+                else:
+                    moves_left[parent] -= 1
+                    if moves_left[parent] == 0:
+                        results[parent] = plies + 1
+                        next_level.append(parent)
+        plies += 1
+    return results
+
+
+def _moves(pieces, squares, turn):
+    """yields (piece index, to square, captured piece index or None) for every move of turn's pieces"""
+    occupied = {square: index for index, square in enumerate(squares)}
+    for index, (color, piece_name) in enumerate(pieces):
+        if color != turn:
+            continue
+        from_square = squares[index]
+        for to_square in _JUMPS[(piece_name, color)][from_square]:
+            target = occupied.get(to_square)
+            if target is None:
+                yield index, to_square, None
+            elif pieces[target][0] != turn:
+                yield index, to_square, target
+        for vector in _SLIDE_VECTORS[(piece_name, color)]:
+            for to_square in _RAYS[vector][from_square]:
+                target = occupied.get(to_square)
+                if target is None:
+                    yield index, to_square, None
+                    continue
+                if pieces[target][0] != turn:
+                    yield index, to_square, target
+                break
+
+
+def _unmoves(pieces, index):
+    """yields table index of every position that reaches position index with one move that captures nothing"""
+    turn = 'b' if index & 1 else 'w'
+    mover = 'w' if turn == 'b' else 'b'
+    squares = []
+    packed = index >> 1
+    for _ in pieces:
+        squares.append(packed & 63)
+        packed >>= 6
+    squares.reverse()
+    occupied = set(squares)
+
+    for piece_index, (color, piece_name) in enumerate(pieces):
+        if color != mover:
+            continue
+        to_square = squares[piece_index]
+        from_squares = [square for square in _JUMPS_FROM[(piece_name, color)][to_square] if square not in occupied]
+        for row_offset, col_offset in _SLIDE_VECTORS[(piece_name, color)]:
+            for square in _RAYS[(-row_offset, -col_offset)][to_square]:
+                if square in occupied:
+                    break
+                from_squares.append(square)
+        for from_square in from_squares:
+            squares[piece_index] = from_square
+            yield position_index(squares, mover)
+        squares[piece_index] = to_square
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ChessVar endgame tablebase generator')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build tablebase for a piece set and the sets it depends on')
+    build.add_argument('piece_set', help='piece letters KQRBNFH, white v black, e.g. KFvK')
+    build.add_argument('directory')
+    args = parser.parse_args()
+
+    os.makedirs(args.directory, exist_ok=True)
+    for path in build_tablebases(args.piece_set, args.directory):
+        print('wrote', path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# Description: checks ChessVar's attack map against a brute force count of every piece's attacks, after each
+# push_move and pop_move of random play, with both board backends. Piece geometry is written out here rather than
+# read from PIECE_MOVEMENTS, so a mistake in the move tables shows up as a mismatch.
+# Run: python test_attack_map.py (or pytest)
+
+import random
+
+from ChessVar import ChessVar, BitboardChessVar
+
+ROOK_LINES = ((0, 1), (0, -1), (1, 0), (-1, 0))
+BISHOP_LINES = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KNIGHT_JUMPS = ((1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1))
+KING_JUMPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# white moves up the board, black's fairy pieces are white's turned around
+LINES = {
+    'Rook': {'w': ROOK_LINES, 'b': ROOK_LINES},
+    'Bishop': {'w': BISHOP_LINES, 'b': BISHOP_LINES},
+    'Queen': {'w': ROOK_LINES + BISHOP_LINES, 'b': ROOK_LINES + BISHOP_LINES},
+    'Falcon': {'w': ((1, 1), (1, -1), (-1, 0)), 'b': ((-1, 1), (-1, -1), (1, 0))},
+    'Hunter': {'w': ((1, 0), (-1, 1), (-1, -1)), 'b': ((-1, 0), (1, 1), (1, -1))},
+}
+
+
+def brute_force_counts(game):
+    """returns {color: list of 64 attack counts} worked out from the board alone"""
+    counts = {'w': [0] * 64, 'b': [0] * 64}
+    for square in range(64):
+        chess_piece = game.get_piece_on(square)
+        if chess_piece is None:
+            continue
+        row, col = divmod(square, 8)
+        name, color = chess_piece.get_name(), chess_piece.get_color()
+        if name == 'Pawn':
+            forward = 1 if color == 'w' else -1
+            targets = [(row + forward, col + 1), (row + forward, col - 1)]
+        elif name in ('Knight', 'King'):
+            jumps = KNIGHT_JUMPS if name == 'Knight' else KING_JUMPS
+            targets = [(row + row_step, col + col_step) for row_step, col_step in jumps]
+        else:
+            targets = []
+            for row_step, col_step in LINES[name][color]:
+                to_row, to_col = row + row_step, col + col_step
+                while 0 <= to_row < 8 and 0 <= to_col < 8:
+                    targets.append((to_row, to_col))
+                    if game.get_piece_on(to_row * 8 + to_col) is not None:
+                        break
+                    to_row, to_col = to_row + row_step, to_col + col_step
+        for to_row, to_col in targets:
+            if 0 <= to_row < 8 and 0 <= to_col < 8:
+                counts[color][to_row * 8 + to_col] += 1
+    return counts
+
+
+def assert_attack_map(game):
+    expected = brute_force_counts(game)
+    for color in ('w', 'b'):
+        assert [game.get_attack_count(square, color) for square in range(64)] == expected[color]
+        assert [game.is_attacked(square, color) for square in range(64)] == [count > 0 for count in expected[color]]
+
+
+def play_checked(game, rng, plies=200):
+    """plays random moves with some pop_moves mixed in, checking the attack map after each, then unwinds the game"""
+    for _ in range(plies):
+        moves = game.generate_moves()
+        if not moves:
+            break
+        if rng.random() < 0.3 and game.get_moves_played():
+            game.pop_move()
+        else:
+            assert game.push_move(rng.choice(moves))
+        assert_attack_map(game)
+    while game.pop_move() is not None:
+        assert_attack_map(game)
+
+
+def test_push_and_pop():
+    for game_class in (ChessVar, BitboardChessVar):
+        for seed in range(30):
+            game = game_class()
+            game.enable_attack_map()
+            assert_attack_map(game)
+            play_checked(game, random.Random(seed))
+
+
+def test_enabled_mid_game():
+    # attack map turned on by the first query, partway through a game, and on a game loaded with from_bytes
+    for game_class in (ChessVar, BitboardChessVar):
+        rng = random.Random(5)
+        game = game_class()
+        for _ in range(30):
+            game.push_move(rng.choice(game.generate_moves()))
+        loaded = game_class.from_bytes(game.to_bytes())
+        assert_attack_map(game)
+        play_checked(game, rng)
+
+        assert_attack_map(loaded)
+        play_checked(loaded, rng)
+
+
+if __name__ == '__main__':
+    test_push_and_pop()
+    test_enabled_mid_game()
+    print('ok')
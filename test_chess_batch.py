@@ -0,0 +1,70 @@
+# Description: checks chess_batch.BoardBatch.validate against ChessVar.valid_move, on every one of the 4096 from and
+# to square pairs of positions reached by random play, with both board backends.
+# Run: python test_chess_batch.py (or pytest)
+
+import random
+
+import numpy as np
+
+from ChessVar import ChessVar, BitboardChessVar, encode_move
+from chess_batch import BoardBatch
+
+ALL_SQUARE_PAIRS = np.arange(4096)
+
+
+def random_games(count, seed=3, max_plies=120):
+    """returns count games of random legal play, alternating backends. Some end with a king captured"""
+    rng = random.Random(seed)
+    games = []
+    for index in range(count):
+        game = (ChessVar, BitboardChessVar)[index % 2]()
+        for _ in range(rng.randrange(max_plies)):
+            moves = game.generate_moves()
+            if not moves:
+                break
+            game.push_move(rng.choice(moves))
+        games.append(game)
+    return games
+
+
+def expected_legal(game, move):
+    """returns ChessVar.valid_move's answer for packed move"""
+    return game.valid_move(move & 7, (move >> 3) & 7, (move >> 6) & 7, move >> 9)
+
+
+def test_every_square_pair():
+    for game in random_games(40):
+        batch = BoardBatch.from_games([game] * len(ALL_SQUARE_PAIRS))
+        expected = [expected_legal(game, move) for move in range(4096)]
+        assert batch.validate(ALL_SQUARE_PAIRS).tolist() == expected
+
+
+def test_mixed_positions():
+    # one batch of different positions, each with its own candidate move, about half of them legal
+    rng = random.Random(7)
+    games = random_games(200, seed=11)
+    moves = []
+    for game in games:
+        legal = [move for move in game.generate_moves() if not move >> 12]
+        if legal and rng.random() < 0.5:
+            moves.append(rng.choice(legal))
+        else:
+            moves.append(rng.randrange(4096))
+    result = BoardBatch.from_games(games).validate(moves).tolist()
+    assert result == [expected_legal(game, move) for game, move in zip(games, moves)]
+
+
+def test_fairy_entries_are_false():
+    game = ChessVar()
+    for square_from, square_to in (('b1', 'c3'), ('g8', 'f6'), ('c3', 'd5'), ('f6', 'd5')):
+        assert game.make_move(square_from, square_to)
+    entry = encode_move(None, 20, 'Falcon')
+    assert entry in game.generate_moves()
+    assert not BoardBatch.from_games([game]).validate([entry])[0]
+
+
+if __name__ == '__main__':
+    test_every_square_pair()
+    test_mixed_positions()
+    test_fairy_entries_are_false()
+    print('ok')
@@ -0,0 +1,59 @@
+# Description: checks chess_book opening books: lookups against the games they were built from, version 1 books
+# without a hash key fingerprint, and files that are not books, cut short, or built with other hash keys.
+# Run: python test_chess_book.py (or pytest)
+
+import os
+import random
+import struct
+import tempfile
+
+import pytest
+
+from ChessVar import ChessVar
+from chess_book import OpeningBook, build_book
+
+
+def random_games(count, plies, seed=1):
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        game = ChessVar()
+        for _ in range(plies):
+            game.push_move(rng.choice(game.generate_moves()))
+        games.append(list(game.get_moves_played()))
+    return games
+
+
+def test_lookup_and_versions():
+    games = random_games(30, 8)
+    first_moves = {}
+    for moves in games:
+        first_moves[moves[0]] = first_moves.get(moves[0], 0) + 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'games.book')
+        size = build_book(games, path, max_ply=4)
+        with OpeningBook(path) as book:
+            assert book.get_size() == size
+            assert dict(book.lookup(ChessVar().get_hash())) == first_moves
+            assert book.choose(ChessVar()) in first_moves
+
+        # the same entries in a version 1 book, header without fingerprint
+        data = open(path, 'rb').read()
+        old_path = os.path.join(directory, 'old.book')
+        with open(old_path, 'wb') as file:
+            file.write(b'CVBOOK' + struct.pack('<HI', 1, size) + data[20:])
+        with OpeningBook(old_path) as book:
+            assert dict(book.lookup(ChessVar().get_hash())) == first_moves
+
+        bad_path = os.path.join(directory, 'bad.book')
+        other_keys = data[:12] + struct.pack('<Q', 12345) + data[20:]
+        for bad in (b'', data[:10], data[:-3], data + b'x', b'XXXXXX' + data[6:], other_keys):
+            with open(bad_path, 'wb') as file:
+                file.write(bad)
+            with pytest.raises(ValueError):
+                OpeningBook(bad_path)
+
+
+if __name__ == '__main__':
+    test_lookup_and_versions()
+    print('ok')
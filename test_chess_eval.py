@@ -0,0 +1,48 @@
+# Description: checks chess_eval.Evaluator scores: running scores kept by attached games against scores of packed
+# positions, and evaluate leaving unattached games untouched.
+# Run: python test_chess_eval.py (or pytest)
+
+import random
+
+from ChessVar import ChessVar, BitboardChessVar
+from chess_eval import Evaluator
+
+
+def test_running_score_matches_packed():
+    evaluator = Evaluator()
+    for game_class in (ChessVar, BitboardChessVar):
+        rng = random.Random(4)
+        game = game_class()
+        evaluator.attach(game)
+        for _ in range(150):
+            moves = game.generate_moves()
+            if not moves:
+                break
+            if rng.random() < 0.3 and game.get_moves_played():
+                game.pop_move()
+            else:
+                game.push_move(rng.choice(moves))
+            assert evaluator.evaluate(game) == evaluator.evaluate_batch([game])[0]
+
+
+def test_evaluate_leaves_game_alone():
+    evaluator = Evaluator()
+    game = ChessVar()
+    for square_from, square_to in (('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5')):
+        game.make_move(square_from, square_to)
+    score = evaluator.evaluate(game)
+    assert game.get_evaluation_tables() is None
+
+    other = Evaluator(piece_square_tables={})
+    other.attach(game)
+    tables = game.get_evaluation_tables()
+    assert evaluator.evaluate(game) == score
+    assert game.get_evaluation_tables()[0] is tables[0]
+    # black to move, running score is white's
+    assert game.get_score() == -other.evaluate_batch([game])[0] != 0
+
+
+if __name__ == '__main__':
+    test_running_score_matches_packed()
+    test_evaluate_leaves_game_alone()
+    print('ok')
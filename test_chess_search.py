@@ -0,0 +1,64 @@
+# Description: checks chess_search.Searcher budgets and its transposition table.
+# Run: python test_chess_search.py (or pytest)
+
+from ChessVar import ChessVar, BitboardChessVar
+from chess_eval import Evaluator
+from chess_search import EXACT, LOWER_BOUND, Searcher, TranspositionTable
+
+
+def test_node_limit_respected():
+    for game_class in (ChessVar, BitboardChessVar):
+        for node_limit in (1, 5, 100, 1000, 3000):
+            game = game_class()
+            result = Searcher(1 << 12).search(game, node_limit=node_limit)
+            assert result.nodes <= node_limit
+            assert game.get_moves_played().tolist() == []
+        # 20 nodes finish depth 1 from the start, depth 2 needs hundreds
+        result = Searcher(1 << 12).search(game_class(), node_limit=100)
+        assert result.depth == 1 and result.move is not None
+
+
+def test_time_limit_zero():
+    result = Searcher(1 << 12).search(ChessVar(), time_limit=0)
+    assert result.depth == 0 and result.move is None and result.nodes <= 1
+
+
+def test_table_keeps_deeper_entries():
+    table = TranspositionTable(16)
+    table.new_search()
+    table.store(5, 4, 10, EXACT, 1)
+    table.store(5, 2, 20, LOWER_BOUND, 2)
+    assert table.probe(5) == (4, 10, EXACT, 1)
+    # another key in the same slot does not replace it either, an equal depth does
+    table.store(5 + 16, 3, 30, EXACT, 3)
+    assert table.probe(5 + 16) is None
+    table.store(5, 4, 40, EXACT, 4)
+    assert table.probe(5) == (4, 40, EXACT, 4)
+    # entries from an earlier search are replaced by anything
+    table.new_search()
+    table.store(5 + 16, 1, 50, EXACT, 5)
+    assert table.probe(5) is None and table.probe(5 + 16) == (1, 50, EXACT, 5)
+
+
+
+def test_search_restores_evaluation():
+    game = ChessVar()
+    game.push_move(Searcher(1 << 12).search(game, max_depth=2).move)
+    assert game.get_evaluation_tables() is None and game.get_score() is None
+
+    # a game keeping a score with other tables gets them back, with its score kept up to date
+    own = Evaluator(piece_square_tables={})
+    own.attach(game)
+    tables = game.get_evaluation_tables()
+    Searcher(1 << 12).search(game, max_depth=2)
+    assert game.get_evaluation_tables()[0] is tables[0] and game.get_evaluation_tables()[1] is tables[1]
+    assert own.evaluate(game) == own.evaluate_batch([game])[0]
+    assert len(game.get_moves_played()) == 1
+
+
+if __name__ == '__main__':
+    test_node_limit_respected()
+    test_time_limit_zero()
+    test_table_keeps_deeper_entries()
+    test_search_restores_evaluation()
+    print('ok')
@@ -0,0 +1,118 @@
+# Description: loopback sessions against chess_server.GameServer: games played over TCP and a Unix socket, pipelined
+# requests answered in order, bad requests answered without dropping the connection, and over-long lines closing it.
+# Run: python test_chess_server.py (or pytest)
+
+import asyncio
+import os
+import tempfile
+
+from ChessVar import square_index
+from chess_server import GameClient, GameServer, SessionManager
+
+
+async def session(server, client):
+    """plays the start of a game through client and checks every response"""
+    game = (await client.request(op='new'))['game']
+    assert await client.request(op='check', game=game, **{'from': 'e2', 'to': 'e4'}) == {'ok': True, 'legal': True}
+    assert await client.request(op='check', game=game, **{'from': 'e2', 'to': 'e5'}) == {'ok': True, 'legal': False}
+    response = await client.request(op='move', game=game, id='a', **{'from': 'e2', 'to': 'e4'})
+    assert response == {'ok': True, 'turn': 'b', 'state': 'UNFINISHED', 'id': 'a'}
+    response = await client.request(op='move', game=game, **{'from': 'e2', 'to': 'e4'})
+    assert response == {'ok': False, 'turn': 'b', 'state': 'UNFINISHED'}
+
+    state = await client.request(op='state', game=game)
+    assert state['turn'] == 'b'
+    assert state['board'][3][4] == 'wPawn' and state['board'][1][4] is None
+    assert server.get_manager().get_game(game).get_piece_on(square_index('e4')).get_name() == 'Pawn'
+
+    assert await client.request(op='close', game=game) == {'ok': True}
+    assert await client.request(op='close', game=game) == {'ok': False}
+    assert await client.request(op='state', game=game) == {'ok': False, 'error': 'no such game'}
+
+
+def test_tcp_and_unix_sessions():
+    async def run():
+        server = GameServer(SessionManager(move_cache_size=100))
+        host, port = await server.start_tcp()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'chess.sock')
+            await server.start_unix(path)
+            for client in (await GameClient.connect_tcp(host, port), await GameClient.connect_unix(path)):
+                await session(server, client)
+                await client.close()
+            await server.close()
+        assert server.get_manager().get_game_count() == 0
+
+    asyncio.run(run())
+
+
+def test_pipelined_and_bad_requests():
+    async def run():
+        server = GameServer()
+        client = await GameClient.connect_tcp(*await server.start_tcp())
+        game = (await client.request(op='new'))['game']
+        requests = [
+            {'op': 'move', 'game': game, 'from': 'e2', 'to': 'e4', 'id': 1},
+            {'op': 'move', 'game': [1], 'from': 'e7', 'to': 'e5', 'id': 2},
+            {'op': 'state', 'game': {'a': 1}, 'id': 3},
+            {'op': 'move', 'game': True, 'from': 'e7', 'to': 'e5', 'id': 4},
+            {'op': 'close', 'game': [1], 'id': 5},
+            {'op': 'move', 'game': game, 'from': 'e7', 'id': 6},
+            {'op': 'check', 'game': game, 'from': 'e7', 'to': 'z', 'id': 7},
+            {'op': 'drop', 'game': game, 'piece': 'Falcon', 'to': 'e6', 'id': 8},
+            {'op': 'fly', 'id': 9},
+            {'op': 'move', 'game': game, 'from': 'e7', 'to': 'e5', 'id': 10},
+        ]
+        responses = await client.request_many(requests)
+        assert [response['id'] for response in responses] == list(range(1, 11))
+        assert responses[0]['ok'] and responses[9]['ok']
+        assert [response['error'] for response in responses[1:7]] == ['bad request'] * 6
+        assert responses[7] == {'ok': False, 'turn': 'b', 'state': 'UNFINISHED', 'id': 8}
+        assert responses[8] == {'ok': False, 'error': 'unknown op', 'id': 9}
+
+        # lines that are not JSON objects, then the connection still works
+        client._writer.write(b'not json\n[1, 2]\n\n')
+        assert [await client._reader.readline() for _ in range(2)] == [b'{"ok":false,"error":"bad request"}\n'] * 2
+        assert (await client.request(op='state', game=game))['turn'] == 'w'
+
+        # moves and drops naming an open game are counted, requests with bad game ids are not
+        stats = await client.request(op='stats')
+        assert stats['ok'] and stats['games'] == 1 and stats['moves'] == 4
+        assert stats['p50_ms'] is not None and 'move_cache' not in stats
+        await client.close()
+        await server.close()
+
+    asyncio.run(run())
+
+
+def test_line_too_long():
+    async def run():
+        server = GameServer(max_line=1000)
+        address = await server.start_tcp()
+        # one line over the limit, and an unfinished line growing past it, each answered then closed
+        for data in (b'{"op": "stats"}\n' + b'x' * 3000 + b'\n', b'x' * 3000):
+            client = await GameClient.connect_tcp(*address)
+            client._writer.write(data)
+            await client._writer.drain()
+            first = await client._reader.readline()
+            if data.startswith(b'{'):
+                assert b'"games"' in first
+                first = await client._reader.readline()
+            assert first == b'{"ok":false,"error":"line too long"}\n'
+            assert await client._reader.read() == b''
+            await client.close()
+
+        # the server keeps serving other connections
+        client = await GameClient.connect_tcp(*address)
+        assert (await client.request(op='new'))['ok']
+        await client.close()
+        await server.close()
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    test_tcp_and_unix_sessions()
+    test_pipelined_and_bad_requests()
+    test_line_too_long()
+    print('ok')
@@ -0,0 +1,138 @@
+# Description: checks chess_tablebase results for KvK, KFvK and KvKH. Every result must follow from the results of
+# the positions its moves lead to, the tablebase's move generator must agree with ChessVar.generate_moves, and a
+# written table must probe the same results back. The full sweep of the three piece sets takes about 20 seconds.
+# Run: python test_chess_tablebase.py (or pytest)
+
+import os
+import random
+import tempfile
+from itertools import product
+
+from ChessVar import (ChessVar, POSITION_FORMAT_VERSION, POSITION_SIZE, POSITION_SQUARES_OFFSET, POSITION_TURN_OFFSET,
+                      encode_move, get_piece_code, get_turn_code)
+from chess_tablebase import (DRAW, INVALID, Tablebase, _moves, generate, parse_piece_set, piece_set_name,
+                             position_index, write_tablebase)
+
+PIECE_SETS = ('KvK', 'KFvK', 'KvKH')
+_SOLVED = {}
+_TABLES = {}
+
+
+def solved_results(name):
+    """returns results array of piece set name, generated once and shared between tests"""
+    generate(name, _SOLVED)
+    return _SOLVED[piece_set_name(parse_piece_set(name))]
+
+
+def pieces_results(pieces):
+    """returns results array for pieces in table order, as solved_results"""
+    if pieces not in _TABLES:
+        _TABLES[pieces] = solved_results(piece_set_name(pieces))
+    return _TABLES[pieces]
+
+
+def arrangements(pieces):
+    """yields every tuple of distinct squares for pieces"""
+    for squares in product(range(64), repeat=len(pieces)):
+        if len(set(squares)) == len(squares):
+            yield squares
+
+
+def expected_result(pieces, squares, turn):
+    """returns result for the position worked out from the stored results of the positions one move away"""
+    other_turn = 'b' if turn == 'w' else 'w'
+    children = []
+    for index, to_square, captured in _moves(pieces, squares, turn):
+        if captured is not None and pieces[captured][1] == 'King':
+            return 1
+        child_pieces, child_squares = pieces, list(squares)
+        child_squares[index] = to_square
+        if captured is not None:
+            del child_squares[captured]
+            child_pieces = pieces[:captured] + pieces[captured + 1:]
+        children.append(pieces_results(child_pieces)[position_index(child_squares, other_turn)])
+
+    # best move: one into the quickest loss for the other player, else, with every move into a win for the other
+    # player, the slowest one. A stuck player or any move into a draw makes a draw
+    losses = [result for result in children if result != DRAW and result % 2 == 0]
+    if losses:
+        return min(losses) + 1
+    if children and all(result % 2 == 1 for result in children):
+        return max(children) + 1
+    return DRAW
+
+
+def check_consistent(name):
+    pieces = parse_piece_set(name)
+    results = solved_results(name)
+    assert len(results) == 2 * 64 ** len(pieces)
+    valid = 0
+    for squares in arrangements(pieces):
+        for turn in ('w', 'b'):
+            index = position_index(squares, turn)
+            assert results[index] == expected_result(pieces, squares, turn), (name, squares, turn)
+            valid += 1
+    assert results.tolist().count(INVALID) == len(results) - valid
+
+
+def test_kvk_consistent():
+    check_consistent('KvK')
+
+
+def test_kfvk_consistent():
+    check_consistent('KFvK')
+
+
+def test_kvkh_consistent():
+    check_consistent('KvKH')
+
+
+def position_game(pieces, squares, turn):
+    """returns ChessVar with pieces on squares, turn to move and no fairy pieces in reserve"""
+    record = bytearray(POSITION_SIZE)
+    record[0] = POSITION_FORMAT_VERSION
+    for (color, piece_name), square in zip(pieces, squares):
+        record[POSITION_SQUARES_OFFSET + square] = get_piece_code(piece_name, color)
+    record[POSITION_TURN_OFFSET] = get_turn_code(turn)
+    return ChessVar.from_bytes(record)
+
+
+def sample_positions(count, seed=1):
+    """yields (piece set name, pieces, squares, turn) for count random positions of each piece set"""
+    rng = random.Random(seed)
+    for name in PIECE_SETS:
+        pieces = parse_piece_set(name)
+        for _ in range(count):
+            yield name, pieces, rng.sample(range(64), len(pieces)), rng.choice('wb')
+
+
+def test_moves_match_chessvar():
+    for name, pieces, squares, turn in sample_positions(2000):
+        expected = sorted(position_game(pieces, squares, turn).generate_moves())
+        found = sorted(encode_move(squares[index], to_square) for index, to_square, _ in _moves(pieces, squares, turn))
+        assert found == expected, (name, squares, turn)
+
+
+def test_written_table_probes():
+    with tempfile.TemporaryDirectory() as directory:
+        for name in PIECE_SETS:
+            path = os.path.join(directory, name + '.cvtb')
+            write_tablebase(path, name, solved_results(name))
+        for name, pieces, squares, turn in sample_positions(500, seed=2):
+            result = solved_results(name)[position_index(squares, turn)]
+            with Tablebase(os.path.join(directory, name + '.cvtb')) as table:
+                assert table.get_name() == name
+                probed = table.probe(position_game(pieces, squares, turn))
+            if result == DRAW:
+                assert probed == ('DRAW', 0)
+            else:
+                assert probed == ('WIN' if result % 2 else 'LOSS', result)
+
+
+if __name__ == '__main__':
+    test_kvk_consistent()
+    test_kfvk_consistent()
+    test_kvkh_consistent()
+    test_moves_match_chessvar()
+    test_written_table_probes()
+    print('ok')
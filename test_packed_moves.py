@@ -0,0 +1,46 @@
+# Description: checks packed moves (ChessVar.encode_move) from push_move, replay and decode_move, including values that
+# are not moves: a fairy code with no piece, more than 14 bits, negative numbers.
+# Run: python test_packed_moves.py (or pytest)
+
+import pytest
+
+from ChessVar import ChessVar, BitboardChessVar, decode_move, encode_game, encode_move, square_index
+
+MALFORMED = (3 << 12 | 5, 3 << 12, 1 << 14, (1 << 14) | 12 | 28 << 6, -1)
+
+
+def test_encode_decode():
+    assert decode_move(encode_move(square_index('e2'), square_index('e4'))) == (12, 28, None)
+    assert decode_move(encode_move(None, square_index('e3'), 'Hunter')) == (0, 20, 'Hunter')
+    for move in MALFORMED:
+        with pytest.raises(ValueError):
+            decode_move(move)
+
+
+def test_push_malformed_move():
+    for game_class in (ChessVar, BitboardChessVar):
+        game = game_class()
+        start = game.to_bytes()
+        for move in MALFORMED:
+            assert game.push_move(move) is False
+        assert game.to_bytes() == start and game.pop_move() is None
+
+
+def test_replay_log_with_malformed_move():
+    moves = list(encode_game([('e2', 'e4'), ('e7', 'e5'), ('g1', 'f3')]))
+    log = moves[:1] + list(MALFORMED) + moves[1:]
+    for game_class in (ChessVar, BitboardChessVar):
+        for trusted in (False, True):
+            expected = game_class()
+            assert all(expected.replay(moves))
+            game = game_class()
+            assert list(game.replay(log, trusted)) == [True] + [False] * len(MALFORMED) + [True, True]
+            assert game.to_bytes() == expected.to_bytes()
+            assert list(game.get_moves_played()) == moves
+
+
+if __name__ == '__main__':
+    test_encode_decode()
+    test_push_malformed_move()
+    test_replay_log_with_malformed_move()
+    print('ok')
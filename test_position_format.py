@@ -0,0 +1,65 @@
+# Description: pins the ChessVar position record layout and Zobrist keys of the original piece types, so saved
+# records and opening books keep loading as pieces are added: a starting position record and hash written out
+# here, and records round tripped through from_bytes.
+# Run: python test_position_format.py (or pytest)
+
+import random
+
+import pytest
+
+from ChessVar import (ChessVar, BitboardChessVar, POSITION_RESERVE_OFFSET, POSITION_SIZE, get_hash_fingerprint,
+                      get_piece_code, get_piece_names)
+
+# record of the starting position: version, rows 1 to 8, white to move, unfinished, no pieces lost, all four fairy
+# pieces in reserve
+START_RECORD = (bytes([1]) + bytes([4, 2, 3, 5, 6, 3, 2, 4]) + bytes([1] * 8) + bytes(32) + bytes([9] * 8)
+                + bytes([12, 10, 11, 13, 14, 11, 10, 12]) + bytes([0, 0]) + bytes(16) + bytes([15]))
+START_HASH = 0xbc6f1e519bf1c27c
+HASH_FINGERPRINT = 0x87aee29de79c39fe
+
+
+def test_original_codes_and_keys():
+    for index, piece_name in enumerate(('Pawn', 'Knight', 'Bishop', 'Rook', 'Queen', 'King', 'Falcon', 'Hunter')):
+        assert get_piece_code(piece_name, 'w') == index + 1
+        assert get_piece_code(piece_name, 'b') == index + 9
+    for game_class in (ChessVar, BitboardChessVar):
+        game = game_class()
+        # the version byte goes up as piece types are added, the original part of the record stays the same
+        assert game.to_bytes()[1:POSITION_RESERVE_OFFSET + 1] == START_RECORD[1:]
+        assert game.get_hash() == START_HASH
+        loaded = game_class.from_bytes(START_RECORD)
+        assert loaded.get_hash() == START_HASH and loaded.to_bytes() == game.to_bytes()
+    assert get_hash_fingerprint() == HASH_FINGERPRINT
+
+
+def test_round_trip():
+    rng = random.Random(8)
+    for game_class in (ChessVar, BitboardChessVar):
+        for _ in range(20):
+            game = game_class()
+            for _ in range(rng.randrange(120)):
+                moves = game.generate_moves()
+                if not moves:
+                    break
+                game.push_move(rng.choice(moves))
+            record = game.to_bytes()
+            assert len(record) == POSITION_SIZE
+            loaded = game_class.from_bytes(b'xx' + record, 2)
+            assert loaded.to_bytes() == record and loaded.get_hash() == game.get_hash()
+            assert loaded.get_board() == game.get_board()
+
+
+def test_bad_records():
+    record = ChessVar().to_bytes()
+    # too short, version 0 or from the future, a piece code past the last piece type
+    for bad in (b'', record[:-1], bytes([0]) + record[1:], bytes([255]) + record[1:],
+                record[:1] + bytes([2 * len(get_piece_names()) + 1]) + record[2:]):
+        with pytest.raises(ValueError):
+            ChessVar.from_bytes(bad)
+
+
+if __name__ == '__main__':
+    test_original_codes_and_keys()
+    test_round_trip()
+    test_bad_records()
+    print('ok')